@@ -16,73 +16,55 @@ Extended with quantum computing specific features:
 
 import sys
 import os
+import socket
 
 # Add the qdashboard package to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from qdashboard.core.app import create_app, get_config
-from qdashboard.web.routes import register_routes
-from qdashboard.web.file_browser import PathView
+import uvicorn
+
+from qdashboard.core.app import build_app
+from qdashboard.cli import _load_env, create_parser, get_default_config
+from qdashboard.core.config import ConfigError, validate_config
+
+
+def find_free_port(host=''):
+    """Bind a socket to a free port on *host* and return it, still open.
+
+    The socket is handed to uvicorn as-is so the port can't be taken between
+    probing and binding.
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    s.bind((host, 0))
+    return s
 
 
 def main():
     """Main entry point for the QDashboard application."""
     
-    # Get configuration
-    config = get_config()
-    
-    # Create Flask app
-    app = create_app()
-    
-    # Register main routes
-    register_routes(app, config)
-    
-    # Register file browser - create a proper class-based view
-    class ConfiguredPathView(PathView):
-        def __init__(self):
-            super().__init__(root_path=config['root'], key=config['key'])
-    
-    path_view = ConfiguredPathView.as_view('path_view')
-    app.add_url_rule('/files', view_func=path_view)
-    app.add_url_rule('/files/<path:p>', view_func=path_view)
+    # Get configuration — CLI args override env vars / defaults
+    _load_env()  # before get_default_config(), so its env vars are available
+    args = create_parser().parse_args()
+    config = get_default_config(args)
+    if args.port is None and 'QD_PORT' not in os.environ:
+        config['port'] = None  # no explicit port: pick a free one below
+    try:
+        validate_config(config)  # also creates the data/logs/temp directories
+    except ConfigError as e:
+        print(f'Configuration error: {e}')
+        sys.exit(1)
     
-    # Check for command line named arguments --port
-    if '--port' in sys.argv:
-        port_index = sys.argv.index('--port') + 1
-        if port_index < len(sys.argv):
-            try:
-                config['port'] = int(sys.argv[port_index])
-            except ValueError:
-                print(f"Invalid port number: {sys.argv[port_index]}")
-                sys.exit(1)
-        else:
-            print("No port number provided after --port argument.")
-            sys.exit(1)
+    # Create FastAPI app with routes and file browser registered
+    app = build_app(config)
     
-    # Set default port if not specified
-    if 'port' not in config or not config['port']:
-        if len(sys.argv) == 1:
-            try:
-                config['port'] = int(sys.argv[1])
-            except ValueError:
-                print(f"Invalid port number: {sys.argv[1]}")
-                sys.exit(1)
-        else:
-            # Check for an available port in the default range
-            import random
-            from socket import socket, AF_INET, SOCK_STREAM
-            
-            def find_free_port():
-                with socket(AF_INET, SOCK_STREAM) as s:
-                    s.bind(('', 0))
-                    return s.getsockname()[1]
+    # Only probe for a free port once everything else is set up
+    listen_socket = None
+    if not config.get('port'):
+        listen_socket = find_free_port(config['host'])
+        config['port'] = listen_socket.getsockname()[1]
+        print(f"No port specified, using random available port: {config['port']}")
 
-            config['port'] = find_free_port()
-            print(f"No port specified, using random available port: {config['port']}")
-
-    # Check for command line port argument
-    
-    
     # Print startup information
     print('Quantum Dashboard Server running on http://{}:{}'.format(config['host'], config['port']))
     print('Serving path: {}'.format(config['root']))
@@ -90,9 +72,16 @@ def main():
     print('Using environment: {}'.format(config['environment']))
     print('Press Ctrl+C to stop')
     
-    # Start the Flask application
+    # Start the ASGI server (uvicorn) — the Werkzeug dev server is gone with Flask
     try:
-        app.run(config['host'], config['port'], threaded=True, debug=False)
+        server = uvicorn.Server(uvicorn.Config(
+            app,
+            host=config['host'],
+            port=int(config['port']),
+            log_level='debug' if config.get('debug') else 'info',
+            timeout_graceful_shutdown=5,
+        ))
+        server.run(sockets=[listen_socket] if listen_socket else None)
     except KeyboardInterrupt:
         print('\nQuantum Dashboard Server stopped')
     except Exception as e:
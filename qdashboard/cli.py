@@ -11,10 +11,10 @@ import argparse
 from typing import Optional, List
 
 import uvicorn
-from qdashboard.core.app import create_app
+from qdashboard import __version__
 from qdashboard.core.config import (
-    DEFAULT_PORT, DEFAULT_HOST, DEFAULT_QD_ROOT,
-    validate_config, set_config, ensure_directory_exists,
+    DEFAULT_PORT, DEFAULT_HOST, DEFAULT_QD_ROOT, TEMP_DIR_NAME,
+    validate_config,
 )
 from qdashboard.utils.logger import get_logger
 
@@ -28,6 +28,12 @@ def create_parser() -> argparse.ArgumentParser:
         epilog='For more information, visit: https://github.com/jevillegasd/qdashboard'
     )
     
+    parser.add_argument(
+        '--version',
+        action='version',
+        version=f'%(prog)s {__version__}'
+    )
+
     parser.add_argument(
         '--port',
         nargs='?',
@@ -123,23 +129,26 @@ def _load_env() -> None:
 
 def get_default_config(args: argparse.Namespace) -> dict:
     """Build config: .env / env vars provide defaults; CLI args override."""
+    # One snapshot of the QD_* variables; every lookup below reads from it
+    env = {name: value for name, value in os.environ.items() if name.startswith('QD_')}
+
     # Resolve QDashboard root — the single source of truth for all dirs
     qd_root = os.path.expanduser(
         args.root
-        or os.environ.get('QD_ROOT', '')
+        or env.get('QD_ROOT', '')
         or DEFAULT_QD_ROOT
     )
     qd_root = os.path.abspath(qd_root)
 
-    data_dir  = os.path.expanduser(os.environ.get('QD_DATA_DIR',  os.path.join(qd_root, 'data')))
-    logs_dir  = os.path.expanduser(os.environ.get('QD_LOGS_DIR',  os.path.join(qd_root, 'logs')))
-    temp_dir  = os.path.expanduser(os.environ.get('QD_TEMP_DIR',  os.path.join(qd_root, 'tmp')))
+    data_dir  = os.path.expanduser(env.get('QD_DATA_DIR',  os.path.join(qd_root, 'data')))
+    logs_dir  = os.path.expanduser(env.get('QD_LOGS_DIR',  os.path.join(qd_root, 'logs')))
+    temp_dir  = os.path.expanduser(env.get('QD_TEMP_DIR',  os.path.join(qd_root, TEMP_DIR_NAME)))
     log_path  = os.path.expanduser(
         args.log_path
-        or os.environ.get('QD_LOG_PATH', os.path.join(logs_dir, 'slurm_output.txt'))
+        or env.get('QD_LOG_PATH') or os.path.join(logs_dir, 'slurm_output.txt')
     )
 
-    env_arg = args.environment or os.environ.get('QD_ENVIRONMENT')
+    env_arg = args.environment or env.get('QD_ENVIRONMENT')
     environment = _detect_launch_environment() if not env_arg or env_arg == 'default' else env_arg
 
     config = {
@@ -149,40 +158,19 @@ def get_default_config(args: argparse.Namespace) -> dict:
         'logs_dir':    logs_dir,
         'temp_dir':    temp_dir,
         'log_path':    log_path,
-        'key':         args.auth_key  or os.environ.get('QD_KEY', ''),
-        'debug':       args.debug     or os.environ.get('QD_DEBUG', 'false').lower() == 'true',
+        'key':         args.auth_key  or env.get('QD_KEY', ''),
+        'debug':       args.debug     or env.get('QD_DEBUG', 'false').lower() == 'true',
         'environment': environment,
         'home_path':   os.path.expanduser(
-                           args.home_path or os.environ.get('QD_HOME_PATH', '~')
+                           args.home_path or env.get('QD_HOME_PATH', '~')
                        ),
-        'host':        args.host or os.environ.get('QD_HOST', os.environ.get('QD_BIND', DEFAULT_HOST)),
-        'port':        int(args.port or os.environ.get('QD_PORT', DEFAULT_PORT)),
+        'host':        args.host or env.get('QD_HOST') or env.get('QD_BIND', DEFAULT_HOST),
+        'port':        int(args.port or env.get('QD_PORT', DEFAULT_PORT)),
     }
-    config['version'] = __import__('qdashboard').__version__
+    config['version'] = __version__
     return config
 
 
-def validate_config_legacy(config: dict) -> None:
-    """Legacy validation function - moved to core.config module."""
-    logger.warning("Using legacy validation function. Consider migrating to core.config.validate_config()")
-    try:
-        from qdashboard.core.config import validate_config
-        validate_config(config)
-    except Exception as e:
-        # Fallback to legacy validation
-        if not (1 <= config['port'] <= 65535):
-            logger.warning(f"Error: Port number must be between 1 and 65535, got {config['port']}")
-            sys.exit(1)
-        
-        if not os.path.exists(config['root']):
-            logger.warning(f"Error: Root directory does not exist: {config['root']}")
-            sys.exit(1)
-        
-        if not os.path.isdir(config['root']):
-            logger.warning(f"Error: Root path is not a directory: {config['root']}")
-            sys.exit(1)
-
-
 def main(argv: Optional[List[str]] = None) -> None:
     """
     Main entry point for the QDashboard CLI.
@@ -196,9 +184,6 @@ def main(argv: Optional[List[str]] = None) -> None:
     args = parser.parse_args(argv)
     config = get_default_config(args)
 
-    for d in ('qd_root', 'data_dir', 'logs_dir', 'temp_dir'):
-        ensure_directory_exists(config[d])
-
     try:
         validate_config(config)
     except Exception as e:
@@ -207,9 +192,7 @@ def main(argv: Optional[List[str]] = None) -> None:
     
     try:
         # Import here to avoid import errors if package is not fully installed
-        from .core.app import create_app
-        from .web.routes import register_routes
-        from .web.file_browser import make_file_router
+        from .core.app import build_app
         from .qpu.platforms import get_platforms_path
 
         logger.info('QDashboard - CLI - Quantum Computing Dashboard')
@@ -222,12 +205,7 @@ def main(argv: Optional[List[str]] = None) -> None:
         except Exception as e:
             logger.warning(f'Error setting up QPU platforms: {e}')
 
-        set_config(config)
-        app = create_app(config)
-        register_routes(app, config)
-
-        file_router = make_file_router(config['data_dir'], config.get('key', ''))
-        app.include_router(file_router)
+        app = build_app(config)
 
         logger.info('QDashboard server starting...')
         logger.info(f'Server running on: http://{config["host"]}:{config["port"]}')
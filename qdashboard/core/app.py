@@ -4,6 +4,7 @@ Core FastAPI application configuration and setup.
 
 import os
 import traceback as _tb
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from starlette.exceptions import HTTPException
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
@@ -11,6 +12,7 @@ from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from .. import __version__
 from ..utils.formatters import size_fmt, time_desc, data_fmt, icon_fmt, time_humanize
 from qdashboard.utils.logger import get_logger
 from .config import DEFAULT_PORT, DEFAULT_HOST, DEFAULT_QD_ROOT, set_config
@@ -21,11 +23,40 @@ logger = get_logger(__name__)
 # Module-level templates instance — imported by route modules
 templates: Jinja2Templates = None  # type: ignore[assignment]
 
+# Package-relative resource directories (constant for the process lifetime)
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ASSETS_DIR = os.path.join(_PACKAGE_DIR, "assets")
+_TEMPLATES_DIR = os.path.join(_PACKAGE_DIR, "templates")
+_ASSETS_CACHE_CONTROL = "public, max-age=3600"
+
+# Custom Jinja2 filters, installed on the templates env in create_app()
+TEMPLATE_FILTERS = {
+    "size_fmt": size_fmt,
+    "time_fmt": time_desc,
+    "data_fmt": data_fmt,
+    "icon_fmt": icon_fmt,
+    "humanize": time_humanize,
+}
+
 _ERROR_ICONS = {404: 'fa-compass', 403: 'fa-lock', 401: 'fa-key', 400: 'fa-exclamation-circle'}
 _ERROR_TITLES = {400: 'Bad Request', 401: 'Unauthorized', 403: 'Forbidden',
                  404: 'Page Not Found', 500: 'Internal Server Error'}
 
 
+class _CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep the bundled CSS/JS/fonts for an hour.
+
+    Starlette already sends ETag/Last-Modified, so once max-age lapses the
+    browser revalidates with a cheap 304 instead of refetching.
+    """
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers.setdefault('Cache-Control', _ASSETS_CACHE_CONTROL)
+        return response
+
+
 def render_error_page(request: Request, status_code: int, message: str = None,
                        trace: str = None) -> HTMLResponse:
     """Render the themed error page (templates/error.html) for HTML routes.
@@ -56,16 +87,36 @@ def create_app(config: dict = None) -> FastAPI:
     """Create and configure the FastAPI application."""
     global templates
 
-    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    assets_dir = os.path.join(package_dir, "assets")
-    templates_dir = os.path.join(package_dir, "templates")
-
     if config is not None:
         set_config(config)
 
+    @asynccontextmanager
+    async def _lifespan(app: FastAPI):
+        # Initialise experiment history DB in a thread-pool executor so it
+        # does not block the event loop. Errors are non-fatal.
+        import asyncio
+        from ..db.database import init_db as _init_db
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, _init_db, config or {})
+        except Exception as _exc:
+            logger.warning(f"DB init failed (non-fatal): {_exc}")
+
+        # Import qibolab here, on the main thread: its drivers may install
+        # signal handlers at import, which fails on the probe threads.
+        from ..qpu.utils import load_qibolab
+        load_qibolab()
+
+        # Discover qibocal protocols in the background so the first page
+        # load doesn't pay for it on the event loop.
+        from ..experiments.protocols import warm_protocol_cache
+        warm_protocol_cache()
+        yield
+
     app = FastAPI(
+        lifespan=_lifespan,
         title="QDashboard",
-        version="0.0.3",
+        version=__version__,
         description=(
             "REST API for the QDashboard quantum computing dashboard.\n\n"
             "QDashboard exposes endpoints for monitoring QPU health, browsing\n"
@@ -123,29 +174,12 @@ def create_app(config: dict = None) -> FastAPI:
     # Store config in app state for access via request.app.state.config
     app.state.config = config or {}
 
-    # Startup: initialise experiment history DB in a thread-pool executor
-    # so it does not block the event loop. Errors are non-fatal.
-    @app.on_event("startup")
-    async def _startup_init_db():
-        import asyncio
-        from ..db.database import init_db as _init_db
-        _cfg = config or {}
-        try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, _init_db, _cfg)
-        except Exception as _exc:
-            logger.warning(f"DB init failed (non-fatal): {_exc}")
-
     # Mount static files at /assets
-    app.mount("/assets", StaticFiles(directory=assets_dir), name="assets")
+    app.mount("/assets", _CachedStaticFiles(directory=_ASSETS_DIR), name="assets")
 
     # Set up Jinja2 templates with custom filters
-    templates = Jinja2Templates(directory=templates_dir)
-    templates.env.filters["size_fmt"] = size_fmt
-    templates.env.filters["time_fmt"] = time_desc
-    templates.env.filters["data_fmt"] = data_fmt
-    templates.env.filters["icon_fmt"] = icon_fmt
-    templates.env.filters["humanize"] = time_humanize
+    templates = Jinja2Templates(directory=_TEMPLATES_DIR)
+    templates.env.filters.update(TEMPLATE_FILTERS)
 
     # HTTPException covers both raised-by-route-code errors (raise HTTPException(404, ...))
     # and Starlette's own "no route matched" 404 — one handler for both.
@@ -232,7 +266,17 @@ def create_app(config: dict = None) -> FastAPI:
     return app
 
 
-def get_config():
-    """Get application configuration from environment variables."""
-    from .config import get_config as _get_config
-    return _get_config()
+def build_app(config: dict) -> FastAPI:
+    """Create the app with the dashboard routes and file browser registered.
+
+    Shared by ``qdashboard.cli`` and the ``app.py`` launcher so both serve the
+    same route table.
+    """
+    from ..web.routes import register_routes
+    from ..web.file_browser import make_file_router
+
+    app = create_app(config)
+    register_routes(app, config)
+    app.include_router(make_file_router(config.get('data_dir') or config['root'],
+                                        config.get('key', '')))
+    return app
@@ -6,6 +6,7 @@ across all modules and avoiding hardcoded values.
 """
 
 import os
+import stat
 from typing import Dict, Any, Optional
 
 
@@ -58,50 +59,56 @@ def get_config_value(key: str, default: Any = None) -> Any:
     Returns:
         Configuration value or default
     """
-    try:
-        return get_config().get(key, default)
-    except ConfigError:
-        return default
+    # Read the module-level store directly: no wrapper call, and no
+    # raise/catch of ConfigError when config has not been set yet.
+    return _config.get(key, default)
+
+
+# Fallbacks for the accessors below, computed once at import
+_DEFAULT_HOME = os.path.expanduser('~')
+_DEFAULT_QD_ROOT = os.path.join(_DEFAULT_HOME, '.qdashboard')
+_DEFAULT_DATA_DIR = os.path.join(_DEFAULT_QD_ROOT, 'data')
+_DEFAULT_LOGS_DIR = os.path.join(_DEFAULT_QD_ROOT, 'logs')
 
 
 def get_temp_dir() -> str:
     """Get the temporary directory path from config."""
-    return get_config_value('temp_dir', '/tmp')
+    return get_config_value('temp_dir', DEFAULT_TEMP_DIR)
 
 
 def get_data_dir() -> str:
     """Get the data directory path from config."""
-    return get_config_value('data_dir', os.path.expanduser('~/.qdashboard/data'))
+    return get_config_value('data_dir', _DEFAULT_DATA_DIR)
 
 
 def get_logs_dir() -> str:
     """Get the logs directory path from config."""
-    return get_config_value('logs_dir', os.path.expanduser('~/.qdashboard/logs'))
+    return get_config_value('logs_dir', _DEFAULT_LOGS_DIR)
 
 
 def get_home_path() -> str:
     """Get the home path from config."""
-    return get_config_value('home_path', os.path.expanduser('~'))
+    return get_config_value('home_path', _DEFAULT_HOME)
 
 
 def get_root_path() -> str:
     """Get the root serving path from config."""
-    return get_config_value('root', os.path.expanduser('~'))
+    return get_config_value('root', _DEFAULT_HOME)
 
 
 def get_qd_root() -> str:
     """Get the QDashboard root directory from config."""
-    return get_config_value('qd_root', os.path.expanduser('~/.qdashboard'))
+    return get_config_value('qd_root', _DEFAULT_QD_ROOT)
 
 
 def get_host() -> str:
     """Get the server host from config."""
-    return get_config_value('host', '127.0.0.1')
+    return get_config_value('host', DEFAULT_HOST)
 
 
 def get_port() -> int:
     """Get the server port from config."""
-    return get_config_value('port', 5005)
+    return get_config_value('port', DEFAULT_PORT)
 
 
 def get_auth_key() -> str:
@@ -132,6 +139,9 @@ def ensure_directory_exists(directory_path: str) -> str:
     return abs_path
 
 
+_PORT_RANGE = range(1, 65536)
+
+
 def validate_config(config: Dict[str, Any]) -> None:
     """
     Validate configuration values and ensure required directories exist.
@@ -142,29 +152,39 @@ def validate_config(config: Dict[str, Any]) -> None:
     Raises:
         ConfigError: If configuration is invalid
     """
-    # Validate port range
+    # Validate port range; None leaves the choice of a free port to the launcher
     port = config.get('port', 5005)
-    if not isinstance(port, int) or not (1 <= port <= 65535):
+    if port is not None and (not isinstance(port, int) or port not in _PORT_RANGE):
         raise ConfigError(f"Port number must be between 1 and 65535, got {port}")
     
-    # Validate root directory
-    root = config.get('root')
-    if root and not os.path.exists(root):
-        raise ConfigError(f"Root directory does not exist: {root}")
-    
-    # Ensure QDashboard directories exist
+    # Ensure QDashboard directories exist up front; experiment submission
+    # still creates the directories it writes into on demand.
     qd_root = config.get('qd_root')
-    if qd_root:
+    directories = [qd_root] + [
+        config.get(key) or (os.path.join(qd_root, name) if qd_root else None)
+        for key, name in (('logs_dir', 'logs'), ('data_dir', 'data'), ('temp_dir', TEMP_DIR_NAME))
+    ]
+    try:
+        for directory in directories:
+            if directory:
+                ensure_directory_exists(directory)
+    except OSError as e:
+        raise ConfigError(f"Cannot create QDashboard directories: {e}") from e
+    
+    # Validate root directory (one stat covers both "exists" and "is a dir")
+    root = config.get('root')
+    if root:
         try:
-            ensure_directory_exists(os.path.join(qd_root, 'logs'))
-            ensure_directory_exists(os.path.join(qd_root, 'data'))
-            ensure_directory_exists(os.path.join(qd_root, 'temp'))
-        except OSError as e:
-            raise ConfigError(f"Cannot create QDashboard directories: {e}") from e
+            st = os.stat(root)
+        except FileNotFoundError:
+            raise ConfigError(f"Root directory does not exist: {root}") from None
+        if not stat.S_ISDIR(st.st_mode):
+            raise ConfigError(f"Root path is not a directory: {root}")
 
 
 # Constants for default values - centralized in one place
 DEFAULT_PORT = 5005
 DEFAULT_HOST = '127.0.0.1'
-DEFAULT_QD_ROOT = os.path.expanduser('~/.qdashboard')
-DEFAULT_TEMP_DIR = '/tmp'
\ No newline at end of file
+DEFAULT_QD_ROOT = _DEFAULT_QD_ROOT
+DEFAULT_TEMP_DIR = '/tmp'
+TEMP_DIR_NAME = 'tmp'  # temp_dir's default, under the QDashboard root
\ No newline at end of file
@@ -5,37 +5,58 @@ Experiment job submission and management functionality.
 import os
 import glob
 import shutil
+import string
 import subprocess
 import tempfile
 import json
 import yaml
 import hashlib
 import time
-import traceback
 from datetime import datetime
-from typing import Dict, Any, Tuple, Optional, List
+from typing import Dict, Any, Tuple, Optional, List, Union
 
 from ..qpu.platforms import get_platforms_path, get_partition
 from ..qpu.monitoring import get_qpu_list
 from ..utils.logger import get_logger
-from ..core.config import get_temp_dir, ensure_directory_exists
+from ..core.config import ensure_directory_exists
 
 logger = get_logger(__name__)
 
+# orjson is an optional speedup for the experiment metadata files
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def generate_experiment_id(runcard_path: str, platform: str) -> str:
-    """Generate a unique experiment ID: YYYYmmDD-<6-char hex hash>."""
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+_MAX_METADATA_BYTES = 1_000_000  # experiment_metadata.json is a few hundred bytes
+# Read once at import: os.umask() can only be read by setting it, which would
+# race with files other threads create
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def generate_experiment_id(runcard_bytes: bytes, platform: str) -> str:
+    """Generate a unique experiment ID: YYYYmmDD-<6-char hex hash>.
+
+    *runcard_bytes* is the serialized runcard exactly as it is written to the
+    experiment directory, so no filesystem round-trip is needed to hash it.
+    """
     now = datetime.now()
     date_str = now.strftime('%Y%m%d')
 
-    hasher = hashlib.md5()
+    # Non-cryptographic fingerprint; 3 bytes gives the 6 hex chars we keep
+    hasher = hashlib.blake2b(digest_size=3)
     hasher.update(platform.encode())
     hasher.update(now.isoformat().encode())
-    if os.path.exists(runcard_path):
-        with open(runcard_path, 'rb') as f:
-            hasher.update(f.read())
+    hasher.update(runcard_bytes)
 
-    return f"{date_str}-{hasher.hexdigest()[:6]}"
+    return f"{date_str}-{hasher.hexdigest()}"
 
 
 def create_experiment_directory(experiment_id: str, platform: str, config: Dict[str, Any]) -> str:
@@ -47,59 +68,63 @@ def create_experiment_directory(experiment_id: str, platform: str, config: Dict[
     return experiment_dir
 
 
-def prepare_runcard_from_path(runcard_path: str, experiment_dir: str) -> Tuple[str, Dict[str, Any]]:
-    """Copy runcard to experiment directory and extract metadata."""
-    if not os.path.exists(runcard_path):
-        raise FileNotFoundError(f"Runcard not found: {runcard_path}")
-    
-    # Copy runcard to experiment directory
-    dest_runcard_path = os.path.join(experiment_dir, 'runcard.yml')
-    shutil.copy2(runcard_path, dest_runcard_path)
-    
-    # Read and validate runcard
-    with open(dest_runcard_path, 'r') as f:
-        runcard_data = yaml.safe_load(f)
-    
+def _validate_runcard(runcard_data: Dict[str, Any]) -> None:
+    """Raise ValueError if *runcard_data* lacks a required field."""
     required_fields = ['platform']
     for field in required_fields:
         if field not in runcard_data:
             raise ValueError(f"Missing required field in runcard: {field}")
-    
-    return dest_runcard_path, runcard_data
 
 
-def prepare_runcard_from_data(runcard_data: Dict[str, Any], experiment_dir: str) -> Tuple[str, Dict[str, Any]]:
-    """Create runcard file from data in experiment directory."""
-    # Validate runcard data
-    required_fields = ['platform']
-    for field in required_fields:
-        if field not in runcard_data:
-            raise ValueError(f"Missing required field in runcard: {field}")
+def _read_runcard(runcard_path: str) -> Tuple[bytes, Dict[str, Any]]:
+    """Read a runcard file once, returning its raw bytes and parsed data."""
+    if not os.path.exists(runcard_path):
+        raise FileNotFoundError(f"Runcard not found: {runcard_path}")
     
-    # Create runcard file in experiment directory
-    dest_runcard_path = os.path.join(experiment_dir, 'runcard.yml')
-    with open(dest_runcard_path, 'w') as f:
-        yaml.dump(runcard_data, f, default_flow_style=False, sort_keys=False)
+    with open(runcard_path, 'rb') as f:
+        runcard_bytes = f.read()
+    runcard_data = yaml.load(runcard_bytes, Loader=_SafeLoader)
+    _validate_runcard(runcard_data)
     
-    return dest_runcard_path, runcard_data
+    return runcard_bytes, runcard_data
 
 
-def create_temp_runcard_from_data(runcard_data: Dict[str, Any], temp_dir: str) -> str:
-    """Create temporary runcard file from data."""
-    # Validate runcard data
-    required_fields = ['platform']
-    for field in required_fields:
-        if field not in runcard_data:
-            raise ValueError(f"Missing required field in runcard: {field}")
-    
-    # Create temporary runcard file
-    temp_runcard_path = os.path.join(temp_dir, 'temp_runcard.yml')
-    ensure_directory_exists(temp_dir)
-    
-    with open(temp_runcard_path, 'w') as f:
-        yaml.dump(runcard_data, f, default_flow_style=False, sort_keys=False)
-    
-    return temp_runcard_path
+def _serialize_runcard(runcard_data: Dict[str, Any]) -> bytes:
+    """Validate *runcard_data* and dump it to the bytes written as runcard.yml."""
+    _validate_runcard(runcard_data)
+    return yaml.dump(runcard_data, Dumper=_SafeDumper,
+                     default_flow_style=False, sort_keys=False).encode()
+
+
+def _load_runcard(source: Union[str, Dict[str, Any]]) -> Tuple[bytes, Dict[str, Any]]:
+    """Return (bytes, data) for a runcard given as a file path or a dict.
+
+    A path is read and parsed once; a dict is dumped once.  The bytes are
+    what gets hashed for the experiment ID and written as runcard.yml.
+    """
+    if isinstance(source, dict):
+        return _serialize_runcard(source), source
+    return _read_runcard(source)
+
+
+def _place_runcard(runcard_bytes: bytes, experiment_dir: str) -> str:
+    """Write the serialized runcard into *experiment_dir* and return its path."""
+    dest_runcard_path = os.path.join(experiment_dir, 'runcard.yml')
+    with open(dest_runcard_path, 'wb') as f:
+        f.write(runcard_bytes)
+    return dest_runcard_path
+
+
+def prepare_runcard_from_path(runcard_path: str, experiment_dir: str) -> Tuple[str, Dict[str, Any]]:
+    """Copy runcard to experiment directory and extract metadata."""
+    runcard_bytes, runcard_data = _load_runcard(runcard_path)
+    return _place_runcard(runcard_bytes, experiment_dir), runcard_data
+
+
+def prepare_runcard_from_data(runcard_data: Dict[str, Any], experiment_dir: str) -> Tuple[str, Dict[str, Any]]:
+    """Create runcard file from data in experiment directory."""
+    runcard_bytes, runcard_data = _load_runcard(runcard_data)
+    return _place_runcard(runcard_bytes, experiment_dir), runcard_data
 
 
 # Legacy function for backward compatibility
@@ -108,6 +133,46 @@ def prepare_runcard(runcard_path: str, experiment_dir: str) -> Tuple[str, Dict[s
     return prepare_runcard_from_path(runcard_path, experiment_dir)
 
 
+# SLURM job script, parsed once at import.  Shell variables are escaped as $$.
+_SLURM_TEMPLATE = string.Template("""#!/bin/bash
+#SBATCH --job-name=${experiment_id}
+#SBATCH --partition=${partition}
+#SBATCH --output=${logs_dir}/slurm_output.log
+# #SBATCH --error=${logs_dir}/slurm_error.log
+#SBATCH --time=01:00:00
+
+# Set environment variables
+export QIBOLAB_PLATFORMS=${platforms_base}
+export QIBO_PLATFORM=${platform}
+
+# Log job information
+echo "Job ID: $$SLURM_JOB_ID"
+echo "Experiment ID: ${experiment_id}"
+echo "Platform: ${platform}"
+echo "Partition: ${partition}"
+echo "Start time: $$(date)"
+echo "Working directory: $$(pwd)"
+echo "Output directory: ${output_dir}"
+
+# Change to experiment directory
+cd ${experiment_dir}
+
+# Activate environment if specified
+${activate_line}
+echo "Activated environment: $$(which python) ($$(python --version 2>&1))"
+
+# Run the experiment
+echo "Running experiment..."
+qq run ${runcard_path} -o ${output_dir} -f${update_flag}
+
+# Log completion
+echo "End time: $$(date)"
+echo "Exit code: $$?"
+
+exit 0
+""")
+
+
 def create_slurm_script(experiment_id: str, experiment_dir: str, runcard_path: str, 
                        platform: str, partition: str, platforms_base: str, 
                        environment: str = None, logs_dir: str = None,
@@ -127,43 +192,18 @@ def create_slurm_script(experiment_id: str, experiment_dir: str, runcard_path: s
     # QD_ENVIRONMENT was unset/'default').
     activate_path = os.path.join(os.path.expanduser(environment), 'bin', 'activate') if environment else None
 
-    job_script_content = f"""#!/bin/bash
-#SBATCH --job-name={experiment_id}
-#SBATCH --partition={partition}
-#SBATCH --output={logs_dir}/slurm_output.log
-# #SBATCH --error={logs_dir}/slurm_error.log
-#SBATCH --time=01:00:00
-
-# Set environment variables
-export QIBOLAB_PLATFORMS={platforms_base}
-export QIBO_PLATFORM={platform}
-
-# Log job information
-echo "Job ID: $SLURM_JOB_ID"
-echo "Experiment ID: {experiment_id}"
-echo "Platform: {platform}"
-echo "Partition: {partition}"
-echo "Start time: $(date)"
-echo "Working directory: $(pwd)"
-echo "Output directory: {output_dir}"
-
-# Change to experiment directory
-cd {experiment_dir}
-
-# Activate environment if specified
-{f'source {activate_path}' if activate_path else '# No environment specified'}
-echo "Activated environment: $(which python) ($(python --version 2>&1))"
-
-# Run the experiment
-echo "Running experiment..."
-qq run {runcard_path} -o {output_dir} -f{'' if auto_update else ' --no-update'}
-
-# Log completion
-echo "End time: $(date)"
-echo "Exit code: $?"
-
-exit 0
-"""
+    job_script_content = _SLURM_TEMPLATE.substitute(
+        experiment_id=experiment_id,
+        experiment_dir=experiment_dir,
+        runcard_path=runcard_path,
+        platform=platform,
+        partition=partition,
+        platforms_base=platforms_base,
+        logs_dir=logs_dir,
+        output_dir=output_dir,
+        activate_line=f'source {activate_path}' if activate_path else '# No environment specified',
+        update_flag='' if auto_update else ' --no-update',
+    )
     
     job_script_path = os.path.join(experiment_dir, 'job_script.sh')
     with open(job_script_path, 'w') as f:
@@ -179,12 +219,37 @@ def save_experiment_metadata(experiment_dir: str, metadata: Dict[str, Any]) -> s
     """Save experiment metadata to JSON file."""
     metadata_path = os.path.join(experiment_dir, 'experiment_metadata.json')
     
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    if orjson is not None:
+        with open(metadata_path, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        with open(metadata_path, 'w') as f:
+            json.dump(metadata, f, indent=2)
     
     return metadata_path
 
 
+def update_last_report_path(config: Dict[str, Any], output_dir: str) -> None:
+    """Record *output_dir* as the latest report, atomically.
+
+    The path is written to a sibling temp file and renamed over the target,
+    so readers (web.reports) never see a truncated file.
+    """
+    last_report_path_file = config.get('last_report_path') or os.path.join(config['logs_dir'], 'last_report_path')
+    ensure_directory_exists(os.path.dirname(last_report_path_file))
+    tmp = tempfile.NamedTemporaryFile(dir=os.path.dirname(last_report_path_file),
+                                      prefix='.last_report_path.', delete=False)
+    try:
+        with tmp:
+            tmp.write(output_dir.encode())
+        # mkstemp creates the file 0600; give it the mode a plain open() would
+        os.chmod(tmp.name, 0o666 & ~_UMASK)
+        os.replace(tmp.name, last_report_path_file)
+    except Exception:
+        os.unlink(tmp.name)
+        raise
+
+
 def submit_slurm_job(job_script_path: str) -> Tuple[bool, str, Optional[str]]:
     """Submit job to SLURM and return success status, message, and job ID."""
     try:
@@ -271,156 +336,125 @@ def submit_experiment(runcard_path: str = None, runcard_data: Dict[str, Any] = N
                 'message': 'Cannot provide both runcard_path and runcard_data, choose one'
             }
         
-        # Ensure QDashboard directories exist
-        ensure_directory_exists(config.get('data_dir', os.path.join(config['qd_root'], 'data')))
-        ensure_directory_exists(config.get('logs_dir', os.path.join(config['qd_root'], 'logs')))
+        # Handle runcard preparation based on input type.  The serialized
+        # runcard is produced once and reused for both the experiment ID hash
+        # and the final runcard.yml — nothing is staged in temp_dir.
+        runcard_bytes, runcard_data_parsed = _load_runcard(runcard_path or runcard_data)
         
-        # Use configured temp directory or fallback
-        temp_dir = config.get('temp_dir') or get_temp_dir()
-        temp_files_to_cleanup = []
-        
-        try:
-            # Handle runcard preparation based on input type
-            if runcard_path:
-                # Traditional path: copy existing file to temp directory
-                temp_runcard_path, runcard_data_parsed = prepare_runcard_from_path(runcard_path, temp_dir)
-                temp_files_to_cleanup.append(temp_runcard_path)
-            else:
-                # New path: create runcard file from data in temp directory
-                temp_runcard_path = create_temp_runcard_from_data(runcard_data, temp_dir)
-                runcard_data_parsed = runcard_data
-                temp_files_to_cleanup.append(temp_runcard_path)
-            
-            platform = runcard_data_parsed['platform']
-            if platform not in get_qpu_list():
-                return {
-                    'success': False,
-                    'message': f'Unknown platform "{platform}": not tracked in the platforms repository'
-                }
+        platform = runcard_data_parsed['platform']
+        if platform not in get_qpu_list():
+            return {
+                'success': False,
+                'message': f'Unknown platform "{platform}": not tracked in the platforms repository'
+            }
 
-            # Generate experiment ID and create directory
-            experiment_id = generate_experiment_id(temp_runcard_path, platform)
-            experiment_dir = create_experiment_directory(experiment_id, platform, config)
-            
-            # Create final runcard in experiment directory
-            if runcard_path:
-                final_runcard_path, _ = prepare_runcard_from_path(runcard_path, experiment_dir)
-            else:
-                final_runcard_path, _ = prepare_runcard_from_data(runcard_data, experiment_dir)
-            
-            # Get platform information
-            platforms_base = get_platforms_path(config['root'])
-            if not platforms_base:
-                return {
-                    'success': False,
-                    'message': 'Platforms directory not available'
-                }
-            
-            # Determine partition
-            partition = runcard_data_parsed.get('partition')
+        # Generate experiment ID and create directory
+        experiment_id = generate_experiment_id(runcard_bytes, platform)
+        experiment_dir = create_experiment_directory(experiment_id, platform, config)
+        
+        # Write the final runcard in the experiment directory
+        final_runcard_path = _place_runcard(runcard_bytes, experiment_dir)
+        
+        # Get platform information
+        platforms_base = get_platforms_path(config['root'])
+        if not platforms_base:
+            return {
+                'success': False,
+                'message': 'Platforms directory not available'
+            }
+        
+        # Determine partition
+        partition = runcard_data_parsed.get('partition')
+        if not partition:
+            partition = get_partition(platform)
             if not partition:
-                partition = get_partition(platform)
-                if not partition:
-                    return {
-                        'success': False,
-                        'message': f'No partition specified and could not infer partition for platform {platform}'
-                    }
-            
-            # Use environment from runcard or config
-            if not environment:
-                environment = runcard_data_parsed.get('environment') or config.get('environment')
-            
-            # Create SLURM script — logs go inside the experiment directory so
-            # the per-experiment log API can find them at <experiment_dir>/logs/
-            job_script_path = create_slurm_script(
-                experiment_id, experiment_dir, final_runcard_path,
-                platform, partition, platforms_base, environment, logs_dir=None,
-                auto_update=auto_update
-            )
-            
-            # Submit job
-            success, message, job_id = submit_slurm_job(job_script_path)
-            
-            if not success:
                 return {
                     'success': False,
-                    'message': message
+                    'message': f'No partition specified and could not infer partition for platform {platform}'
                 }
-            
-            # Save experiment metadata
-            metadata = {
-                'experiment_id': experiment_id,
-                'job_id': job_id,
-                'platform': platform,
-                'partition': partition,
-                'environment': environment,
-                'submitted_at': time.time(),
-                'experiment_dir': experiment_dir,
-                'output_dir': os.path.join(experiment_dir, 'output'),
-                'runcard_path': final_runcard_path,
-                'job_script_path': job_script_path,
-                'type': 'new_experiment',
-                'source': 'runcard_path' if runcard_path else 'runcard_data'
+        
+        # Use environment from runcard or config
+        if not environment:
+            environment = runcard_data_parsed.get('environment') or config.get('environment')
+        
+        # Create SLURM script — logs go inside the experiment directory so
+        # the per-experiment log API can find them at <experiment_dir>/logs/
+        job_script_path = create_slurm_script(
+            experiment_id, experiment_dir, final_runcard_path,
+            platform, partition, platforms_base, environment, logs_dir=None,
+            auto_update=auto_update
+        )
+        
+        # Submit job
+        success, message, job_id = submit_slurm_job(job_script_path)
+        
+        if not success:
+            return {
+                'success': False,
+                'message': message
             }
-            if node_name:
-                metadata['node_name'] = node_name
+        
+        # Save experiment metadata
+        metadata = {
+            'experiment_id': experiment_id,
+            'job_id': job_id,
+            'platform': platform,
+            'partition': partition,
+            'environment': environment,
+            'submitted_at': time.time(),
+            'experiment_dir': experiment_dir,
+            'output_dir': os.path.join(experiment_dir, 'output'),
+            'runcard_path': final_runcard_path,
+            'job_script_path': job_script_path,
+            'type': 'new_experiment',
+            'source': 'runcard_path' if runcard_path else 'runcard_data'
+        }
+        if node_name:
+            metadata['node_name'] = node_name
+
+        save_experiment_metadata(experiment_dir, metadata)
 
-            save_experiment_metadata(experiment_dir, metadata)
+        # Write to experiment history DB (non-fatal)
+        try:
+            from ..db.database import (get_db_connection, get_or_create_qpu,
+                                       upsert_experiment_run, add_qpu_qubits,
+                                       _extract_protocol_info)
+            with get_db_connection(config) as conn:
+                qpu_id = get_or_create_qpu(conn, platform)
+                protocol_id, protocol_name, qubit_list = _extract_protocol_info(
+                    runcard_data_parsed, node_name=node_name
+                )
+                if qubit_list:
+                    add_qpu_qubits(conn, qpu_id, qubit_list)
+                upsert_experiment_run(conn, {
+                    'experiment_id': experiment_id,
+                    'qpu_id': qpu_id,
+                    'protocol_id': protocol_id,
+                    'protocol_name': protocol_name,
+                    'target_qubits': qubit_list,
+                    'submitted_at': metadata['submitted_at'],
+                    'slurm_job_id': job_id,
+                    'status': 'pending',
+                    'runcard_path': final_runcard_path,
+                    'output_dir': metadata['output_dir'],
+                })
+        except Exception as _db_exc:
+            logger.warning(f"DB write failed (non-fatal): {_db_exc}")
 
-            # Write to experiment history DB (non-fatal)
-            try:
-                from ..db.database import (get_db_connection, get_or_create_qpu,
-                                           upsert_experiment_run, add_qpu_qubits,
-                                           _extract_protocol_info)
-                with get_db_connection(config) as conn:
-                    qpu_id = get_or_create_qpu(conn, platform)
-                    protocol_id, protocol_name, qubit_list = _extract_protocol_info(
-                        runcard_data_parsed, node_name=node_name
-                    )
-                    if qubit_list:
-                        add_qpu_qubits(conn, qpu_id, qubit_list)
-                    upsert_experiment_run(conn, {
-                        'experiment_id': experiment_id,
-                        'qpu_id': qpu_id,
-                        'protocol_id': protocol_id,
-                        'protocol_name': protocol_name,
-                        'target_qubits': qubit_list,
-                        'submitted_at': metadata['submitted_at'],
-                        'slurm_job_id': job_id,
-                        'status': 'pending',
-                        'runcard_path': final_runcard_path,
-                        'output_dir': metadata['output_dir'],
-                    })
-            except Exception as _db_exc:
-                logger.warning(f"DB write failed (non-fatal): {_db_exc}")
-
-            # Update last report path using config
-            last_report_path_file = config.get('last_report_path') or os.path.join(config['logs_dir'], 'last_report_path')
-            ensure_directory_exists(os.path.dirname(last_report_path_file))
-            with open(last_report_path_file, 'w') as f:
-                f.write(metadata['output_dir'])
-            
-            logger.info(f"New experiment submitted: {experiment_id}")
-            
-            return {
-                'success': True,
-                'message': 'Experiment submitted successfully',
-                'experiment_id': experiment_id,
-                'job_id': job_id,
-                'experiment_dir': experiment_dir,
-                'output_dir': metadata['output_dir'],
-                'metadata': metadata
-            }
-            
-        finally:
-            # Clean up temporary files
-            for temp_file in temp_files_to_cleanup:
-                try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                        logger.debug(f"Cleaned up temporary file: {temp_file}")
-                except Exception as cleanup_error:
-                    logger.warning(f"Failed to cleanup temporary file {temp_file}: {cleanup_error}")
+        # Update last report path using config
+        update_last_report_path(config, metadata['output_dir'])
+        
+        logger.info(f"New experiment submitted: {experiment_id}")
+        
+        return {
+            'success': True,
+            'message': 'Experiment submitted successfully',
+            'experiment_id': experiment_id,
+            'job_id': job_id,
+            'experiment_dir': experiment_dir,
+            'output_dir': metadata['output_dir'],
+            'metadata': metadata
+        }
         
     except Exception as e:
         error_msg = f"Error submitting experiment: {str(e)}"
@@ -443,27 +477,24 @@ def repeat_experiment(report_path: str, config: Dict[str, Any]) -> Dict[str, Any
         Dictionary with submission results
     """
     try:
-        # Ensure QDashboard directories exist
-        os.makedirs(config.get('data_dir', os.path.join(config['qd_root'], 'data')), exist_ok=True)
-        os.makedirs(config.get('logs_dir', os.path.join(config['qd_root'], 'logs')), exist_ok=True)
-        logs_dir = config.get('logs_dir', os.path.join(config['qd_root'], 'logs'))
-
         # Construct full path
         full_report_path = os.path.join(config['root'], report_path.lstrip('/'))
         
-        if not os.path.exists(full_report_path):
+        # Find runcard in the report directory, stopping at the first match
+        runcard_path = None
+        try:
+            with os.scandir(full_report_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith('runcard') and name.endswith('.yml') and entry.is_file():
+                        runcard_path = entry.path
+                        break
+        except (FileNotFoundError, NotADirectoryError):
             return {
                 'success': False,
                 'message': f'Report path does not exist: {report_path}'
             }
         
-        # Find runcard in the report directory
-        runcard_path = None
-        for filename in os.listdir(full_report_path):
-            if filename.startswith('runcard') and filename.endswith('.yml'):
-                runcard_path = os.path.join(full_report_path, filename)
-                break
-        
         if not runcard_path:
             return {
                 'success': False,
@@ -471,8 +502,9 @@ def repeat_experiment(report_path: str, config: Dict[str, Any]) -> Dict[str, Any
             }
         
         # Read runcard to get platform and environment info
-        with open(runcard_path, 'r') as f:
-            runcard_data = yaml.safe_load(f)
+        with open(runcard_path, 'rb') as f:
+            runcard_bytes = f.read()
+        runcard_data = yaml.load(runcard_bytes, Loader=_SafeLoader)
         
         platform = runcard_data.get('platform')
         if not platform:
@@ -487,11 +519,11 @@ def repeat_experiment(report_path: str, config: Dict[str, Any]) -> Dict[str, Any
             }
 
         # Generate experiment ID for repeat experiment
-        experiment_id = generate_experiment_id(runcard_path, platform)
+        experiment_id = generate_experiment_id(runcard_bytes, platform)
         experiment_dir = create_experiment_directory(experiment_id, platform, config)
         
-        # Copy runcard to experiment directory
-        final_runcard_path, _ = prepare_runcard_from_path(runcard_path, experiment_dir)
+        # Copy runcard to experiment directory (from the bytes already read)
+        final_runcard_path = _place_runcard(runcard_bytes, experiment_dir)
         
         # Get platform information
         platforms_base = get_platforms_path(config['root'])
@@ -518,7 +550,7 @@ def repeat_experiment(report_path: str, config: Dict[str, Any]) -> Dict[str, Any
         report_parameters_path = os.path.join(full_report_path, 'parameters.json')
         if os.path.exists(report_parameters_path):
             backup_parameters_path = os.path.join(experiment_dir, 'original_parameters.json')
-            shutil.copy2(report_parameters_path, backup_parameters_path)
+            shutil.copyfile(report_parameters_path, backup_parameters_path)
             logger.info(f"Backed up original parameters.json for reference")
         
         # Create SLURM script — logs go inside the experiment directory
@@ -556,10 +588,7 @@ def repeat_experiment(report_path: str, config: Dict[str, Any]) -> Dict[str, Any
         save_experiment_metadata(experiment_dir, metadata)
         
         # Update last report path using config
-        last_report_path_file = config.get('last_report_path') or os.path.join(config['logs_dir'], 'last_report_path')
-        ensure_directory_exists(os.path.dirname(last_report_path_file))
-        with open(last_report_path_file, 'w') as f:
-            f.write(metadata['output_dir'])
+        update_last_report_path(config, metadata['output_dir'])
         
         logger.info(f"Repeat experiment submitted: {experiment_id} (original: {report_path})")
         
@@ -575,22 +604,134 @@ def repeat_experiment(report_path: str, config: Dict[str, Any]) -> Dict[str, Any
         }
         
     except Exception as e:
-        error_msg = f"Error repeating experiment: {traceback.format_exc() if 'traceback' in globals() else str(e)}"
-        logger.error(error_msg)
+        error_msg = f"Error repeating experiment: {str(e)}"
+        logger.exception("Error repeating experiment")
         return {
             'success': False,
             'message': error_msg
         }
 
 
+def _resolve_data_dir(config: Optional[Dict[str, Any]]) -> str:
+    """Return the experiments data directory for *config* (or from QD_ROOT)."""
+    if config:
+        return config.get('data_dir') or os.path.join(config['qd_root'], 'data')
+    qd_root = os.path.normpath(os.getenv('QD_ROOT', os.path.expanduser('~/.qdashboard')))
+    return os.path.join(qd_root, 'data')
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _subdirs(path: str) -> List[str]:
+    """Return the paths of the directories directly under *path* (or [] if unreadable)."""
+    try:
+        with os.scandir(path) as it:
+            return [entry.path for entry in it if entry.is_dir()]
+    except OSError:
+        return []
+
+
+def _load_metadata(metadata_path: str) -> Optional[Dict[str, Any]]:
+    """Load an experiment_metadata.json; None if it is missing or oversized."""
+    try:
+        with open(metadata_path, 'rb', buffering=4096) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > _MAX_METADATA_BYTES:
+                logger.warning(f"Skipping oversized experiment metadata ({size} bytes): {metadata_path}")
+                return None
+            return _loads_json(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def _read_experiment_status(metadata_path: str) -> Optional[Dict[str, Any]]:
+    """Load an experiment_metadata.json and enrich it with live status fields.
+
+    Returns None if the metadata file does not exist.
+    """
+    metadata = _load_metadata(metadata_path)
+    if metadata is None:
+        return None
+    return _add_live_status(metadata)
+
+
+def _add_live_status(metadata: Dict[str, Any],
+                     slurm_states: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Add the output, SLURM and report status fields to *metadata*.
+
+    *slurm_states* maps job ids to their get_job_states() state; without
+    it the experiment's own job is looked up with squeue.
+    """
+    # Check if output directory exists and has results — listdir doubles as
+    # the existence check, and its result answers the report checks below
+    output_dir = metadata.get('output_dir')
+    try:
+        metadata['output_files'] = os.listdir(output_dir) if output_dir else []
+        metadata['has_output'] = bool(output_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        metadata['has_output'] = False
+        metadata['output_files'] = []
+
+    # --- SLURM-aware status ---
+    # If the experiment was submitted via SLURM, check the live job state
+    # first so we can short-circuit the filesystem poll while the job is
+    # still in the queue.
+    slurm_job_id = metadata.get('job_id')
+    slurm_state = None
+    if slurm_job_id:
+        try:
+            from ..qpu.slurm import check_slurm_job_status, _SLURM_ACTIVE_STATES
+            if slurm_states is None:
+                slurm_state = check_slurm_job_status(slurm_job_id)
+            else:
+                slurm_state = slurm_states.get(str(slurm_job_id), 'UNKNOWN')
+            metadata['slurm_state'] = slurm_state
+            if slurm_state in _SLURM_ACTIVE_STATES:
+                # Job is still alive — no need to touch the filesystem
+                metadata['status'] = 'running' if slurm_state == 'RUNNING' else 'pending'
+                metadata['report_available'] = False
+                # Still expose the log path so the UI can tail it
+                exp_dir = metadata.get('experiment_dir', '')
+                slurm_log = os.path.join(exp_dir, 'logs', 'slurm_output.log')
+                metadata['has_slurm_log'] = os.path.exists(slurm_log)
+                return metadata
+            # Job has left the queue (COMPLETED / FAILED / CANCELLED / UNKNOWN)
+            # Fall through to filesystem check; treat missing output as failed.
+        except Exception as _slurm_err:
+            logger.debug("SLURM status check failed for job %s: %s", slurm_job_id, _slurm_err)
+
+    # Compute dynamic status from the output listing
+    has_report = 'index.html' in metadata['output_files']
+    if has_report or 'meta.json' in metadata['output_files']:
+        metadata['status'] = 'completed'
+        metadata['report_available'] = has_report
+    elif metadata.get('has_output'):
+        # Output dir exists but no report yet — could still be post-processing
+        metadata['status'] = 'running'
+        metadata['report_available'] = False
+    elif slurm_state is not None:
+        # Job left the queue but produced no output → it failed
+        metadata['status'] = 'failed'
+        metadata['report_available'] = False
+    else:
+        metadata['status'] = metadata.get('status', 'pending')
+        metadata['report_available'] = False
+
+    # Check SLURM log if available
+    exp_dir = metadata.get('experiment_dir', '')
+    metadata['has_slurm_log'] = os.path.exists(
+        os.path.join(exp_dir, 'logs', 'slurm_output.log'))
+
+    return metadata
+
+
 def get_experiment_status(experiment_id: str, config: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
     """Get status information for an experiment."""
     try:
-        if config:
-            data_dir = config.get('data_dir') or os.path.join(config['qd_root'], 'data')
-        else:
-            qd_root = os.path.normpath(os.getenv('QD_ROOT', os.path.expanduser('~/.qdashboard')))
-            data_dir = os.path.join(qd_root, 'data')
+        data_dir = _resolve_data_dir(config)
 
         # Search across nested platform/date structure.
         # Try two-level (data_dir/<platform>/<date>/<id>) first,
@@ -601,73 +742,7 @@ def get_experiment_status(experiment_id: str, config: Dict[str, Any] = None) ->
         matches = glob.glob(pattern2) or glob.glob(pattern1)
         if not matches:
             return None
-        metadata_path = matches[0]
-        
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
-        
-        # Check if output directory exists and has results
-        output_dir = metadata.get('output_dir')
-        if output_dir and os.path.exists(output_dir):
-            metadata['has_output'] = True
-            metadata['output_files'] = os.listdir(output_dir)
-        else:
-            metadata['has_output'] = False
-            metadata['output_files'] = []
-
-        # --- SLURM-aware status ---
-        # If the experiment was submitted via SLURM, check the live job state
-        # first so we can short-circuit the filesystem poll while the job is
-        # still in the queue.
-        slurm_job_id = metadata.get('job_id')
-        slurm_state = None
-        if slurm_job_id:
-            try:
-                from ..qpu.slurm import check_slurm_job_status, _SLURM_ACTIVE_STATES
-                slurm_state = check_slurm_job_status(slurm_job_id)
-                metadata['slurm_state'] = slurm_state
-                if slurm_state in _SLURM_ACTIVE_STATES:
-                    # Job is still alive — no need to touch the filesystem
-                    metadata['status'] = 'running' if slurm_state == 'RUNNING' else 'pending'
-                    metadata['report_available'] = False
-                    # Still expose the log path so the UI can tail it
-                    exp_dir = metadata.get('experiment_dir', '')
-                    slurm_log = os.path.join(exp_dir, 'logs', 'slurm_output.log')
-                    metadata['has_slurm_log'] = os.path.exists(slurm_log)
-                    return metadata
-                # Job has left the queue (COMPLETED / FAILED / CANCELLED / UNKNOWN)
-                # Fall through to filesystem check; treat missing output as failed.
-            except Exception as _slurm_err:
-                logger.debug("SLURM status check failed for job %s: %s", slurm_job_id, _slurm_err)
-
-        # Compute dynamic status from filesystem
-        report_index = os.path.join(output_dir or '', 'index.html') if output_dir else ''
-        meta_json = os.path.join(output_dir or '', 'meta.json') if output_dir else ''
-        if os.path.exists(report_index) or os.path.exists(meta_json):
-            metadata['status'] = 'completed'
-            metadata['report_available'] = os.path.exists(report_index)
-        elif metadata.get('has_output'):
-            # Output dir exists but no report yet — could still be post-processing
-            metadata['status'] = 'running'
-            metadata['report_available'] = False
-        elif slurm_state is not None:
-            # Job left the queue but produced no output → it failed
-            metadata['status'] = 'failed'
-            metadata['report_available'] = False
-        else:
-            metadata['status'] = metadata.get('status', 'pending')
-            metadata['report_available'] = False
-
-        # Check SLURM log if available
-        exp_dir = metadata.get('experiment_dir', '')
-        logs_dir = os.path.join(exp_dir, 'logs')
-        slurm_log_path = os.path.join(logs_dir, 'slurm_output.log')
-        if os.path.exists(slurm_log_path):
-            metadata['has_slurm_log'] = True
-        else:
-            metadata['has_slurm_log'] = False
-
-        return metadata
+        return _read_experiment_status(matches[0])
         
     except Exception as e:
         logger.error(f"Error getting experiment status: {str(e)}")
@@ -677,27 +752,39 @@ def get_experiment_status(experiment_id: str, config: Dict[str, Any] = None) ->
 def list_user_experiments(config: Dict[str, Any] = None) -> List[Dict[str, Any]]:
     """List all experiments, walking data_dir/<platform>/<date>/<id> structure."""
     try:
-        if config:
-            data_dir = config.get('data_dir') or os.path.join(config['qd_root'], 'data')
-        else:
-            qd_root = os.path.normpath(os.getenv('QD_ROOT', os.path.expanduser('~/.qdashboard')))
-            data_dir = os.path.join(qd_root, 'data')
-
-        if not os.path.exists(data_dir):
+        data_dir = _resolve_data_dir(config)
+
+        # scandir's DirEntry.is_dir() comes from the directory listing itself,
+        # so walking the three levels costs no per-entry stat.  Each metadata
+        # file is read once, in place, rather than re-globbed by experiment id.
+        metadata_paths = [
+            os.path.join(experiment_dir, 'experiment_metadata.json')
+            for platform_dir in _subdirs(data_dir)
+            for date_dir in _subdirs(platform_dir)
+            for experiment_dir in _subdirs(date_dir)
+        ]
+        if not metadata_paths:
             return []
 
+        all_metadata = []
+        for metadata_path in metadata_paths:
+            try:
+                metadata = _load_metadata(metadata_path)
+            except Exception:
+                continue
+            if metadata and metadata.get('experiment_id'):
+                all_metadata.append(metadata)
+
+        # One squeue for every submitted job instead of one per experiment
+        from ..qpu.slurm import get_job_states
+        slurm_states = get_job_states(m['job_id'] for m in all_metadata if m.get('job_id'))
+
         experiments = []
-        for metadata_path in glob.glob(os.path.join(data_dir, '*', '*', '*', 'experiment_metadata.json')):
+        for metadata in all_metadata:
             try:
-                with open(metadata_path) as f:
-                    metadata = json.load(f)
-                experiment_id = metadata.get('experiment_id')
-                if experiment_id:
-                    status = get_experiment_status(experiment_id, config)
-                    if status:
-                        experiments.append(status)
+                experiments.append(_add_live_status(metadata, slurm_states))
             except Exception:
-                pass
+                continue
         
         # Sort by submission time (newest first)
         experiments.sort(key=lambda x: x.get('submitted_at', 0), reverse=True)
@@ -764,7 +851,7 @@ def find_latest_experiment(
                 continue
             try:
                 with open(runcard_path) as f:
-                    rc = yaml.safe_load(f)
+                    rc = yaml.load(f, Loader=_SafeLoader)
                 if not rc or rc.get("platform") != platform:
                     continue
                 actions = rc.get("actions") or []
@@ -1,11 +1,17 @@
 """
 Experiment and protocol management utilities.
+
+qibocal.protocols is imported once, at module import, which happens on the
+main thread when the web routes are loaded.  Discovery afterwards only walks
+the already-imported PROTOCOLS registry, so it is safe from worker threads.
 """
 
 import inspect
 import importlib
+import re
 import threading
-import traceback
+from collections import defaultdict
+from functools import lru_cache
 
 try:
     from qibocal.auto.operation import Parameters, Results, Data, Protocol
@@ -20,11 +26,6 @@ except Exception as _qibocal_exc:
 
 from qdashboard.utils.logger import get_logger
 
-
-# Global cache for protocols to avoid repeated discovery
-_protocol_cache = None
-_cache_lock = threading.Lock()
-
 logger = get_logger(__name__)
 
 if not QIBOCAL_AVAILABLE:
@@ -34,31 +35,59 @@ if not QIBOCAL_AVAILABLE:
     )
 
 
+# Cleared while warm_protocol_cache() has discovery running in the background;
+# the lock makes checking and clearing it one step
+_warmup_done = threading.Event()
+_warmup_done.set()
+_warmup_lock = threading.Lock()
+
+
 def get_qibocal_protocols():
     """
     Discover all available qibocal protocols from qibocal.protocols.PROTOCOLS,
     the registry qibocal itself uses to resolve runcard actions by id.
-    Returns a dictionary categorized by protocol type. Results are cached.
+    Returns a dictionary categorized by protocol type. Results are cached
+    for the life of the process.
     """
-    global _protocol_cache
+    if not _warmup_done.is_set():
+        _warmup_done.wait()  # let the startup warm-up finish instead of racing it
+    return _discover_protocols()
+
 
+@lru_cache(maxsize=1)
+def _discover_protocols():
+    """Uncached body of get_qibocal_protocols(), memoized here."""
     if not QIBOCAL_AVAILABLE:
         return _get_fallback_protocols()
 
-    with _cache_lock:
-        if _protocol_cache is not None:
-            return _protocol_cache
-
     try:
-        protocols = _get_protocols_direct()
+        return _get_protocols_direct()
     except Exception as e:
         logger.warning(f"Error discovering qibocal protocols: {e}")
-        logger.debug(f"Full traceback:\n{traceback.format_exc()}")
-        protocols = _get_fallback_protocols()
+        logger.debug("Full traceback", exc_info=True)
+        return _get_fallback_protocols()
+
+
+def warm_protocol_cache() -> None:
+    """Run protocol discovery in a daemon thread so requests find it cached."""
+    with _warmup_lock:
+        if not _warmup_done.is_set():
+            return  # already warming up
+        _warmup_done.clear()
+
+    def _warm():
+        try:
+            _discover_protocols()
+        finally:
+            _warmup_done.set()
+
+    threading.Thread(target=_warm, name="protocol-warmup", daemon=True).start()
+
 
-    with _cache_lock:
-        _protocol_cache = protocols
-    return protocols
+@lru_cache(maxsize=None)
+def _cached_import(module_path: str):
+    """importlib.import_module, memoized per module path."""
+    return importlib.import_module(module_path)
 
 
 def _get_protocols_direct() -> dict:
@@ -68,104 +97,117 @@ def _get_protocols_direct() -> dict:
     action's 'operation' field, so it is used as-is for 'id'/'class_name'.
     """
     routine_protocols = []
+    skipped = []
     for protocol_id, routine_obj in PROTOCOLS.items():
-        module_path = routine_obj.acquisition.__module__
+        try:
+            module_path = routine_obj.acquisition.__module__
+        except AttributeError as e:
+            skipped.append((protocol_id, repr(e)))
+            continue
         routine_protocols.append({
             'id': protocol_id,
             'name': protocol_id.replace('_', ' ').title(),
             'class_name': protocol_id,
             'module_name': module_path.rsplit('.', 2)[-2] if '.' in module_path else module_path,
             'module_path': module_path,
-            'routine_obj': routine_obj,
         })
 
-    return _categorize_protocols(routine_protocols)
-
-
+    if skipped:
+        # One record for all of them; a qibocal mismatch can affect many entries
+        logger.warning("Skipped %d qibocal protocols without an acquisition module: %s",
+                       len(skipped), skipped)
+
+    # class_name is the registry key, so entries are unique already
+    return _categorize_protocols(routine_protocols, already_unique=True)
+
+
+# Known qibocal protocols, used when discovery from qibocal is not possible
+_FALLBACK_PROTOCOLS = (
+    {'id': 'rabi', 'name': 'Rabi', 'class_name': 'Rabi', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.rabi'},
+    {'id': 'ramsey', 'name': 'Ramsey', 'class_name': 'Ramsey', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.ramsey'},
+    {'id': 't1', 'name': 'T1', 'class_name': 'T1', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.t1'},
+    {'id': 't2', 'name': 'T2', 'class_name': 'T2', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.t2'},
+    {'id': 'spin_echo', 'name': 'Spin Echo', 'class_name': 'SpinEcho', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.spin_echo'},
+    {'id': 'resonator_spectroscopy', 'name': 'Resonator Spectroscopy', 'class_name': 'ResonatorSpectroscopy', 'module_name': 'spectroscopy', 'module_path': 'qibocal.protocols.spectroscopy.resonator_spectroscopy'},
+    {'id': 'qubit_spectroscopy', 'name': 'Qubit Spectroscopy', 'class_name': 'QubitSpectroscopy', 'module_name': 'spectroscopy', 'module_path': 'qibocal.protocols.spectroscopy.qubit_spectroscopy'},
+    {'id': 'standard_rb', 'name': 'Standard RB', 'class_name': 'StandardRB', 'module_name': 'verification', 'module_path': 'qibocal.protocols.verification.standard_rb'},
+    {'id': 'allxy', 'name': 'AllXY', 'class_name': 'AllXY', 'module_name': 'verification', 'module_path': 'qibocal.protocols.verification.allxy'},
+    {'id': 'drag', 'name': 'DRAG', 'class_name': 'DRAG', 'module_name': 'calibration', 'module_path': 'qibocal.protocols.calibration.drag'},
+    {'id': 'single_shot_classification', 'name': 'Single Shot Classification', 'class_name': 'SingleShotClassification', 'module_name': 'readout', 'module_path': 'qibocal.protocols.readout.single_shot_classification'},
+    {'id': 'chevron', 'name': 'Chevron', 'class_name': 'Chevron', 'module_name': 'two_qubit', 'module_path': 'qibocal.protocols.two_qubit.chevron'},
+    {'id': 'cross_resonance', 'name': 'Cross Resonance', 'class_name': 'CrossResonance', 'module_name': 'two_qubit', 'module_path': 'qibocal.protocols.two_qubit.cross_resonance'},
+)
+
+
+@lru_cache(maxsize=1)
 def _get_fallback_protocols() -> dict:
     """
     Return a hardcoded list of known qibocal protocols as fallback.
     """
-    fallback_protocols = [
-        {'id': 'rabi', 'name': 'Rabi', 'class_name': 'Rabi', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.rabi'},
-        {'id': 'ramsey', 'name': 'Ramsey', 'class_name': 'Ramsey', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.ramsey'},
-        {'id': 't1', 'name': 'T1', 'class_name': 'T1', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.t1'},
-        {'id': 't2', 'name': 'T2', 'class_name': 'T2', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.t2'},
-        {'id': 'spin_echo', 'name': 'Spin Echo', 'class_name': 'SpinEcho', 'module_name': 'characterization', 'module_path': 'qibocal.protocols.characterization.spin_echo'},
-        {'id': 'resonator_spectroscopy', 'name': 'Resonator Spectroscopy', 'class_name': 'ResonatorSpectroscopy', 'module_name': 'spectroscopy', 'module_path': 'qibocal.protocols.spectroscopy.resonator_spectroscopy'},
-        {'id': 'qubit_spectroscopy', 'name': 'Qubit Spectroscopy', 'class_name': 'QubitSpectroscopy', 'module_name': 'spectroscopy', 'module_path': 'qibocal.protocols.spectroscopy.qubit_spectroscopy'},
-        {'id': 'standard_rb', 'name': 'Standard RB', 'class_name': 'StandardRB', 'module_name': 'verification', 'module_path': 'qibocal.protocols.verification.standard_rb'},
-        {'id': 'allxy', 'name': 'AllXY', 'class_name': 'AllXY', 'module_name': 'verification', 'module_path': 'qibocal.protocols.verification.allxy'},
-        {'id': 'drag', 'name': 'DRAG', 'class_name': 'DRAG', 'module_name': 'calibration', 'module_path': 'qibocal.protocols.calibration.drag'},
-        {'id': 'single_shot_classification', 'name': 'Single Shot Classification', 'class_name': 'SingleShotClassification', 'module_name': 'readout', 'module_path': 'qibocal.protocols.readout.single_shot_classification'},
-        {'id': 'chevron', 'name': 'Chevron', 'class_name': 'Chevron', 'module_name': 'two_qubit', 'module_path': 'qibocal.protocols.two_qubit.chevron'},
-        {'id': 'cross_resonance', 'name': 'Cross Resonance', 'class_name': 'CrossResonance', 'module_name': 'two_qubit', 'module_path': 'qibocal.protocols.two_qubit.cross_resonance'},
-    ]
-    
-    return _categorize_protocols(fallback_protocols)
-
-
-def _categorize_protocols(routine_protocols) -> dict:
+    return _categorize_protocols(list(_FALLBACK_PROTOCOLS))
+
+
+# Display order of the protocol categories
+_CATEGORY_ORDER = (
+    "Characterization", "Calibration", "Verification", "Coherence",
+    "Spectroscopy", "Readout", "Two-Qubit", "Couplers", "Other",
+)
+
+# (category, keywords) checked in order; a protocol goes to the first
+# category with a keyword contained in its class or module name.
+_CATEGORY_RULES = (
+    ("Spectroscopy", ('spectroscopy', 'resonator_spectroscopy', 'qubit_spectroscopy', 'punchout')),
+    ("Readout", ('readout', 'classification', 'single_shot', 'state_discrimination')),
+    ("Coherence", ('coherence', 't1', 't2', 'spin_echo', 'ramsey')),
+    ("Couplers", ('coupler', 'avoided_crossing')),
+    ("Two-Qubit", ('cross_resonance', 'chevron', 'two_qubit', 'chsh', 'mermin', 'tomography')),
+    ("Verification", ('rb', 'randomized_benchmarking', 'allxy', 'standard_rb', 'filtered_rb')),
+    ("Calibration", ('drag', 'calibration', 'optimization', 'tuning')),
+    ("Characterization", ('rabi', 'characterization')),
+)
+
+# One compiled alternation per category, searched against "class|module"
+_CATEGORY_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in _CATEGORY_RULES
+)
+
+
+def _categorize_protocols(routine_protocols, already_unique: bool = False) -> dict:
     """
     Categorize protocols based on their name patterns.
+
+    Pass ``already_unique=True`` when the caller guarantees distinct class
+    names, to skip the duplicate-removal pass.
     """
-    # Remove duplicates based on class name
-    seen = set()
-    unique_protocols = []
-    for protocol in routine_protocols:
-        key = protocol['class_name']
-        if key not in seen:
-            seen.add(key)
-            unique_protocols.append(protocol)
+    if already_unique:
+        unique_protocols = routine_protocols
+    else:
+        # Remove duplicates based on class name
+        seen = set()
+        unique_protocols = []
+        for protocol in routine_protocols:
+            key = protocol['class_name']
+            if key not in seen:
+                seen.add(key)
+                unique_protocols.append(protocol)
     
     # Categorize protocols
-    categorized = {
-        "Characterization": [],
-        "Calibration": [],
-        "Verification": [],
-        "Coherence": [],
-        "Spectroscopy": [],
-        "Readout": [],
-        "Two-Qubit": [],
-        "Couplers": [],
-        "Other": []
-    }
+    categorized = defaultdict(list)
     
     for protocol in unique_protocols:
-        name_lower = protocol['name'].lower()
-        module_name = protocol['module_name'].lower()
-        class_name = protocol['class_name'].lower()
+        combined = f"{protocol['class_name']}|{protocol['module_name']}".lower()
         
-        # Categorize based on protocol name patterns
-        if any(keyword in class_name or keyword in module_name 
-               for keyword in ['spectroscopy', 'resonator_spectroscopy', 'qubit_spectroscopy', 'punchout']):
-            categorized["Spectroscopy"].append(protocol)
-        elif any(keyword in class_name or keyword in module_name 
-                 for keyword in ['readout', 'classification', 'single_shot', 'state_discrimination', ]):
-            categorized["Readout"].append(protocol)
-        elif any(keyword in class_name or keyword in module_name 
-                 for keyword in ['coherence', 't1', 't2', 'spin_echo', 'ramsey']):
-            categorized["Coherence"].append(protocol)
-        elif any(keyword in class_name or keyword in module_name 
-                 for keyword in ['coupler', 'avoided_crossing']):
-            categorized["Couplers"].append(protocol)
-        elif any(keyword in class_name or keyword in module_name 
-                 for keyword in ['cross_resonance', 'chevron', 'two_qubit', 'chsh', 'mermin', 'tomography']):
-            categorized["Two-Qubit"].append(protocol)
-        elif any(keyword in class_name or keyword in module_name 
-                 for keyword in ['rb', 'randomized_benchmarking', 'allxy', 'standard_rb', 'filtered_rb']):
-            categorized["Verification"].append(protocol)
-        elif any(keyword in class_name or keyword in module_name 
-                 for keyword in ['drag', 'calibration', 'optimization', 'tuning']):
-            categorized["Calibration"].append(protocol)
-        elif any(keyword in class_name or keyword in module_name 
-                 for keyword in ['rabi', 'characterization']):
-            categorized["Characterization"].append(protocol)
+        # First matching rule wins, based on protocol name patterns
+        for category, pattern in _CATEGORY_PATTERNS:
+            if pattern.search(combined):
+                break
         else:
-            categorized["Other"].append(protocol)
+            category = "Other"
+        categorized[category].append(protocol)
     
-    # Remove empty categories
-    categorized = {k: v for k, v in categorized.items() if v}
+    # Only non-empty categories were created; put them in display order
+    categorized = {k: categorized[k] for k in _CATEGORY_ORDER if k in categorized}
     
     logger.info(f"Discovered {sum(len(v) for v in categorized.values())} qibocal protocols across {len(categorized)} categories")
     
@@ -202,7 +244,9 @@ def get_protocol_attributes(protocol: dict) -> dict:
 
     try:
         if isinstance(protocol, dict):
-            routine_obj = protocol.get('routine_obj')
+            # Resolve through the registry rather than carrying the Routine
+            # object around in the cached protocol dicts
+            routine_obj = PROTOCOLS.get(protocol.get('id'))
         elif isinstance(protocol, str):
             routine_obj = PROTOCOLS.get(protocol)
             if routine_obj is None:
@@ -215,14 +259,14 @@ def get_protocol_attributes(protocol: dict) -> dict:
                 "class_name": protocol
             }
         if routine_obj:
-            protocol_class = importlib.import_module(routine_obj.acquisition.__module__)
+            protocol_class = _cached_import(routine_obj.acquisition.__module__)
         else:
             # If not available, dynamically import the protocol class
             module_path = protocol['module_path']
             class_name = protocol['class_name']
             try:
                 # The module path might point to the class itself or the containing module
-                module = importlib.import_module(module_path)
+                module = _cached_import(module_path)
                 protocol_class = getattr(module, class_name)
             except (ModuleNotFoundError, AttributeError):
                 # Fallback for cases where module_path is 'qibocal.protocols.ClassName'
@@ -230,7 +274,7 @@ def get_protocol_attributes(protocol: dict) -> dict:
                 parts = module_path.rsplit('.', 1)
                 if len(parts) == 2:
                     base_module_path, _ = parts
-                    module = importlib.import_module(base_module_path)
+                    module = _cached_import(base_module_path)
                     protocol_class = getattr(module, class_name)
                 else:
                     raise
@@ -241,18 +285,20 @@ def get_protocol_attributes(protocol: dict) -> dict:
         data_class = None
         logger.debug(f"Inspecting protocol: {protocol_class.__name__}")
         try:
-
             # Inspect inner classes of the protocol to find the ones that inherit
-            # from Parameters, Results, and Data.
-            for _, inner_class in inspect.getmembers(protocol_class, inspect.isclass):
-                    logger.debug(f"Found inner class: {inner_class.__name__}")
-                #if inner_class.__module__ == protocol_class.__module__: # Ensure it's an inner class
-                    if issubclass(inner_class, Parameters) and inner_class is not Parameters:
-                        parameters_class = inner_class
-                    elif issubclass(inner_class, Results) and inner_class is not Results:
-                        results_class = inner_class
-                    elif issubclass(inner_class, Data) and inner_class is not Data:
-                        data_class = inner_class
+            # from Parameters, Results, and Data.  A plain dir()/getattr pass
+            # skips inspect.getmembers' sorting and per-member predicate calls.
+            for name in dir(protocol_class):
+                inner_class = getattr(protocol_class, name, None)
+                if not isinstance(inner_class, type):
+                    continue
+                logger.debug(f"Found inner class: {inner_class.__name__}")
+                if issubclass(inner_class, Parameters) and inner_class is not Parameters:
+                    parameters_class = inner_class
+                elif issubclass(inner_class, Results) and inner_class is not Results:
+                    results_class = inner_class
+                elif issubclass(inner_class, Data) and inner_class is not Data:
+                    data_class = inner_class
         except (ImportError, TypeError):
             # Fallback to getattr for older qibocal versions or different structures
             parameters_class = getattr(protocol_class, 'Parameters', None)
@@ -293,7 +339,7 @@ def get_protocol_attributes(protocol: dict) -> dict:
 
     except (ImportError, AttributeError, KeyError) as e:
         logger.error(f"Could not get attributes for protocol {protocol.get('name', 'N/A')}: {e}")
-        logger.debug(f"Full traceback:\n{traceback.format_exc()}")
+        logger.debug("Full traceback", exc_info=True)
         return {
             "inputs": {"error": "Could not retrieve attributes."},
             "results": {"error": "Could not retrieve attributes."},
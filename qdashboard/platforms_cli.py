@@ -3,8 +3,10 @@
 QDashboard Platforms Manager - CLI tool to manage qibolab platforms repository
 """
 
+import os
 import sys
 import argparse
+import subprocess
 from qdashboard.qpu.platforms import (
     ensure_platforms_directory, 
     update_platforms_repository,
@@ -18,6 +20,14 @@ from qdashboard.qpu.platforms import (
 from qdashboard.utils.logger import get_logger
 logger = get_logger(__name__)
 
+
+def _list_platforms(path):
+    """Sorted names of the platform directories in *path* (hidden/private skipped)."""
+    with os.scandir(path) as entries:
+        return sorted(e.name for e in entries
+                      if e.is_dir() and not e.name.startswith(('.', '_')))
+
+
 def cmd_setup(args):
     """Set up the platforms directory."""
     try:
@@ -25,12 +35,10 @@ def cmd_setup(args):
         print(f"✅ Platforms directory ready at: {path}")
         
         # List available platforms
-        import os
         if os.path.exists(path):
-            platforms = [d for d in os.listdir(path) 
-                        if os.path.isdir(os.path.join(path, d)) and not d.startswith('.') and not d.startswith('_')]
+            platforms = _list_platforms(path)
             if platforms:
-                print(f"📋 Available platforms: {', '.join(sorted(platforms))}")
+                print(f"📋 Available platforms: {', '.join(platforms)}")
             else:
                 print("📋 No platforms found in directory")
                 
@@ -61,8 +69,6 @@ def cmd_update(args):
 
 def cmd_status(args):
     """Show status of platforms directory."""
-    import os
-    
     # Check environment variable
     env_path = os.environ.get('QIBOLAB_PLATFORMS')
     if env_path:
@@ -102,7 +108,6 @@ def cmd_status(args):
                 
                 # Try to get git remote info
                 try:
-                    import subprocess
                     result = subprocess.run(['git', '-C', path, 'remote', 'get-url', 'origin'], 
                                           capture_output=True, text=True, check=True)
                     remote_url = result.stdout.strip()
@@ -113,10 +118,9 @@ def cmd_status(args):
                 print("   ❌ Not a git repository")
                 
             # List platforms
-            platforms = [d for d in os.listdir(path) 
-                        if os.path.isdir(os.path.join(path, d)) and not d.startswith('.') and not d.startswith('_')]
+            platforms = _list_platforms(path)
             if platforms:
-                print(f"   📋 Platforms ({len(platforms)}): {', '.join(sorted(platforms))}")
+                print(f"   📋 Platforms ({len(platforms)}): {', '.join(platforms)}")
             else:
                 print("   📋 No platforms found")
         else:
@@ -183,11 +187,9 @@ def cmd_switch(args):
                 print(f"📝 Latest commit: {new_info['commit']} - {new_info['commit_message']}")
             
             # List platforms after switch
-            import os
-            platforms = [d for d in os.listdir(path) 
-                        if os.path.isdir(os.path.join(path, d)) and not d.startswith('.') and not d.startswith('_')]
+            platforms = _list_platforms(path)
             if platforms:
-                print(f"📋 Available platforms: {', '.join(sorted(platforms))}")
+                print(f"📋 Available platforms: {', '.join(platforms)}")
         else:
             print(f"❌ Failed to switch to branch: {args.branch}")
             sys.exit(1)
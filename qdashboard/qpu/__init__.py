@@ -1,32 +1,35 @@
 """QPU management and monitoring utilities."""
 
-from .platforms import (
-    ensure_platforms_directory, 
-    get_platforms_path, 
-    update_platforms_repository,
-    list_repository_branches,
-    switch_repository_branch,
-    get_current_branch_info
-)
-from .monitoring import (
-    get_available_qpus,
-    get_qibo_versions,
-)
+import importlib
 
-from .utils import (
-    detect_and_save_qibolab_version,
-    is_qibolab_new_api
-)
+# Public name -> submodule that defines it. Submodules are imported on first
+# attribute access (PEP 562), so e.g. importing qdashboard.qpu.platforms does
+# not also pull in monitoring and its qibolab imports.
+_LAZY_EXPORTS = {
+    'ensure_platforms_directory': '.platforms',
+    'get_platforms_path': '.platforms',
+    'update_platforms_repository': '.platforms',
+    'list_repository_branches': '.platforms',
+    'switch_repository_branch': '.platforms',
+    'get_current_branch_info': '.platforms',
+    'get_available_qpus': '.monitoring',
+    'get_qibo_versions': '.monitoring',
+    'detect_and_save_qibolab_version': '.utils',
+    'is_qibolab_new_api': '.utils',
+}
 
-__all__ = [
-    'ensure_platforms_directory',
-    'get_platforms_path', 
-    'update_platforms_repository',
-    'list_repository_branches',
-    'switch_repository_branch',
-    'get_current_branch_info',
-    'get_available_qpus',
-    'get_qibo_versions',
-    'detect_and_save_qibolab_version', 
-    'is_qibolab_new_api'
-]
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,36 +3,144 @@ QPU health monitoring and status utilities.
 """
 
 import os
+import re
+import atexit
+import threading
 import json
+import time
+import functools
 import subprocess
 import traceback
-import signal
+import importlib.metadata
+from concurrent.futures import ThreadPoolExecutor, wait, TimeoutError as FutureTimeoutError
 from datetime import datetime
 from packaging import version
 from qdashboard.utils.logger import get_logger
-from .slurm import check_queue_running_jobs
-from .platforms import get_platforms_path
-from .utils import detect_and_save_qibolab_version, is_qibolab_new_api, get_qibolab_version_from_file
+from .platforms import get_platforms_path, _load_queues
+from .slurm import SLURM_TIMEOUT_S, get_running_partitions
+from .utils import (
+    detect_and_save_qibolab_version, is_qibolab_new_api, get_qibolab_version_from_file,
+    load_qibolab, get_qibolab_platform,
+)
 from .topology import get_topology_from_platform, get_topology_from_qpu_config
 
-# Optional qibolab imports
-try:
-    from qibolab._core.backends import QibolabBackend
-    from qibolab._core.platform.platform import Platform as QibolabPlatform
-    from qibolab import create_platform
-    QIBOLAB_AVAILABLE = True
-except ImportError:
-    QIBOLAB_AVAILABLE = False
-
 logger = get_logger(__name__)
 
-def check_qpu_queue_status(qpu_name, queue_name):
+def _ttl_cache(seconds, cache=None):
+    """
+    Memoize a function's results per argument tuple for *seconds*.
+
+    Meant for the platform scans repeated on every dashboard refresh.
+    Concurrent misses on the same arguments run the function once; the
+    others wait for its result. Expired entries are dropped whenever a new
+    one is stored, and exceptions are never cached. Keyword arguments are
+    passed through on a miss but don't key the cache. Pass a module-level
+    dict as *cache* to be able to clear it.
+    """
+    if cache is None:
+        cache = {}  # args -> (stored_at, value)
+
+    def decorator(func):
+        lock = threading.Lock()  # guards cache and key_locks
+        key_locks = {}  # args -> lock held while computing that entry
+
+        def lookup(args):
+            hit = cache.get(args)
+            if hit is not None and time.monotonic() - hit[0] < seconds:
+                return hit
+            return None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            hit = lookup(args)
+            if hit is not None:
+                return hit[1]
+            with lock:
+                key_lock = key_locks.setdefault(args, threading.Lock())
+            with key_lock:
+                hit = lookup(args)  # filled while we waited?
+                if hit is not None:
+                    return hit[1]
+                value = func(*args, **kwargs)
+                with lock:
+                    now = time.monotonic()
+                    for key in [k for k, (stored_at, _) in cache.items()
+                                if now - stored_at >= seconds]:
+                        del cache[key]
+                    cache[args] = (now, value)
+                    for key in [k for k, key_lock in key_locks.items()
+                                if k not in cache and not key_lock.locked()]:
+                        del key_locks[key]
+            return value
+
+        return wrapper
+    return decorator
+
+
+# Long-lived pools for get_qpu_details(), so a refresh doesn't spawn and
+# join a fresh set of threads. Connection probes (SLURM, ping) and parameter
+# lookups, which may wait on a slow qibolab platform build, get separate
+# pools so the latter can't starve the former. Tasks must not submit work
+# back to their own pool.
+_PROBE_WORKERS = 16  # cap on QPUs probed concurrently
+_PROBE_POOL = ThreadPoolExecutor(max_workers=_PROBE_WORKERS, thread_name_prefix='qpu-probe')
+atexit.register(_PROBE_POOL.shutdown, wait=False)
+# Builds run one at a time on the qibolab thread, so a few waiters suffice
+_PARAMS_WORKERS = 4
+_PARAMS_POOL = ThreadPoolExecutor(max_workers=_PARAMS_WORKERS, thread_name_prefix='qpu-params')
+atexit.register(_PARAMS_POOL.shutdown, wait=False)
+_HEALTH_BUDGET_S = 15  # how long get_qpu_details() waits for all probes
+
+# Process-wide cache of get_qibo_versions() results, shared by every request
+# that arrives without a (valid) qibo_versions cookie.
+# Entries expire like the cookie, so upgrades show up within a day without
+# a restart; the lock makes concurrent misses fill it once.
+_VERSIONS_CACHE_TTL = 24 * 60 * 60  # seconds, same as the cookie
+_versions_cache = None  # (fetched_at, versions) or None
+_versions_lock = threading.Lock()
+
+
+def _get_online_partitions():
+    """
+    Return the set of SLURM partitions currently known to sinfo.
+
+    One ``sinfo`` call covers every QPU, instead of one ``sinfo -p`` each.
+    Returns an empty set if sinfo is unavailable or fails.
+    """
+    try:
+        output = subprocess.check_output(['sinfo', '-h', '-o', '%P'],
+                                         stderr=subprocess.DEVNULL,
+                                         timeout=SLURM_TIMEOUT_S).decode()
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        return set()
+    # sinfo marks the default partition with a trailing '*'
+    return {name.rstrip('*') for name in output.split()}
+
+
+@_ttl_cache(seconds=10)
+def _slurm_snapshot():
+    """
+    Partition state shared by every QPU status check in a refresh window.
+
+    Returns:
+        dict: 'partitions' (known to sinfo) and 'running_partitions' (a
+        Counter of running jobs per partition); two SLURM calls in total
+        instead of two per QPU
+    """
+    return {
+        'partitions': _get_online_partitions(),
+        'running_partitions': get_running_partitions(),
+    }
+
+
+def check_qpu_queue_status(qpu_name, queue_name, slurm=None):
     """
     Check if a QPU is online based on SLURM queue status.
     
     Args:
         qpu_name: Name of the QPU
         queue_name: Name of the SLURM queue for this QPU
+        slurm: Result of _slurm_snapshot(); fetched here if not given
         
     Returns:
         str: Status - 'online', 'running', 'connection error', or 'offline'
@@ -40,35 +148,44 @@ def check_qpu_queue_status(qpu_name, queue_name):
     if queue_name == 'N/A':
         return 'offline'
     
-    try:
-        sinfo_output = subprocess.check_output(['sinfo', '-p', queue_name]).decode()
-        if queue_name in sinfo_output:
-            # Check if there are running jobs in this queue
-            if check_queue_running_jobs(queue_name):
-                return 'running'
-            else:
-                # For more detailed connection checking, we can optionally add ping tests
-                # For now, just return online if queue is available
-                return 'online'
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass  # Keep as offline if sinfo fails
+    if slurm is None:
+        slurm = _slurm_snapshot()
+    if queue_name in slurm['partitions']:
+        # Check if there are running jobs in this queue
+        if queue_name in slurm['running_partitions']:
+            return 'running'
+        else:
+            # For more detailed connection checking, we can optionally add ping tests
+            # For now, just return online if queue is available
+            return 'online'
     
     return 'offline'
 
 
-def get_connection_status(qpu_name, queue_name):
+def get_connection_status(qpu_name, queue_name, slurm=None, timeout=None):
     """
     Get connection status for a QPU including detailed connection tests.
     
     Args:
         qpu_name: Name of the QPU
         queue_name: Name of the SLURM queue for this QPU
+        slurm: Optional result of _slurm_snapshot()
+        timeout: Seconds to wait for the qibolab platform build, if any
         
     Returns:
         str: Connection status - 'online', 'running', 'connection error', or 'offline'
     """
+    try:
+        return _connection_status(qpu_name, queue_name, slurm, timeout)
+    except FutureTimeoutError:
+        logger.warning(f"Timed out building the platform of {qpu_name}")
+        return 'connection error'
+
+
+def _connection_status(qpu_name, queue_name, slurm, timeout):
+    """get_connection_status(), raising FutureTimeoutError if the build timed out."""
     # First check basic queue status
-    basic_status = check_qpu_queue_status(qpu_name, queue_name)
+    basic_status = check_qpu_queue_status(qpu_name, queue_name, slurm)
     
     if basic_status == 'offline':
         return 'offline'
@@ -78,40 +195,73 @@ def get_connection_status(qpu_name, queue_name):
         # For 'online' status, do additional connection tests
         try:
             # Get the electronics IP from the configuration
-            electronics_ip = get_instruments_ip(qpu_name)
+            electronics_ip = get_instruments_ip(qpu_name, timeout)
             logger.debug(f"Electronics IP for {qpu_name}: {electronics_ip}")
             
-            # Create ping script
-            job_script = f"""#!/bin/bash
-# Job script to ping electronics IPs for {qpu_name}
-for ip in {electronics_ip}; do
-    ping -c 1 $ip > /dev/null 2>&1
-    if [ $? -ne 0 ]; then
-        echo "Connection error to $ip"
-        exit 1
-    fi
-done
-echo "All electronics IPs are reachable"
-"""
-            with open('ping_electronics.sh', 'w') as script_file:
-                script_file.write(job_script)
-            
-            os_process = subprocess.run(
-                ["bash", "ping_electronics.sh"],
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=5
-            )
-            
-            if os_process.returncode != 0:
+            if electronics_ip == 'N/A' or not _ping_all(electronics_ip):
                 return 'connection error'
-            else:
-                return 'online'
+            return 'online'
                 
-        except subprocess.TimeoutExpired:
-            return 'connection error'
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
+        except FutureTimeoutError:
+            raise
+        except Exception:
             return 'offline'
 
 
+@_ttl_cache(seconds=10)
+def _shared_connection_status(qpu_name, queue_name, deadline=None):
+    """
+    Connection status against the current SLURM snapshot.
+
+    Kept as long as the snapshot itself, so repeated renders within it
+    probe each QPU only once. A time.monotonic() *deadline* bounds the wait
+    for the platform build; a probe it cuts short raises FutureTimeoutError,
+    which _ttl_cache doesn't store, so the next request probes again.
+    """
+    return _connection_status(qpu_name, queue_name, _slurm_snapshot(),
+                              _remaining(deadline))
+
+
+def _budgeted_connection_status(qpu_name, queue_name, deadline):
+    """_shared_connection_status(), or 'connection error' once *deadline* passed."""
+    try:
+        return _shared_connection_status(qpu_name, queue_name, deadline=deadline)
+    except FutureTimeoutError:
+        logger.warning(f"Timed out building the platform of {qpu_name}")
+        return 'connection error'
+
+
+_PING_DEADLINE_S = 1.5  # for all of a QPU's pings together (each waits 1 s)
+
+
+def _ping_all(ips):
+    """
+    True if every address in *ips* answers a single ICMP echo.
+
+    All pings are started at once and reaped against one shared deadline, so
+    the check takes about the slowest round trip rather than their sum, with
+    no helper threads. The first failure settles the answer and the
+    remaining pings are killed.
+    """
+    procs = []
+    try:
+        for ip in ips:
+            procs.append(subprocess.Popen(['ping', '-c', '1', '-W', '1', str(ip)],
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+        deadline = time.monotonic() + _PING_DEADLINE_S
+        for proc in procs:
+            if proc.wait(timeout=max(0, deadline - time.monotonic())) != 0:
+                return False
+        return True
+    except (subprocess.TimeoutExpired, OSError):
+        return False
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+
 def get_qpu_queue_mapping(qrc_path):
     """
     Get the mapping of QPU names to queue names from queues.json.
@@ -120,47 +270,104 @@ def get_qpu_queue_mapping(qrc_path):
         qrc_path: Path to the platforms directory
         
     Returns:
-        dict: Mapping of QPU names to queue names
+        dict: Mapping of QPU names to queue names (shared; do not mutate)
     """
     try:
-        with open(os.path.join(qrc_path, 'queues.json'), 'r') as f:
-            return json.load(f)
-    except (IOError, json.JSONDecodeError):
+        # Same mtime-keyed parse get_partition uses: re-read only on change
+        return _load_queues(os.path.join(qrc_path, 'queues.json'))
+    except (OSError, json.JSONDecodeError):
         return {}
 
 
+@_ttl_cache(seconds=5)
+def _scan_platform_dirs(qrc_path):
+    """(name, path) of every platform directory in *qrc_path* with a platform.py."""
+    platforms = []
+    with os.scandir(qrc_path) as entries:
+        for entry in entries:
+            if entry.name.startswith(('_', '.')):
+                continue
+            # is_dir() uses the type readdir already returned; one stat
+            # for platform.py replaces listing the whole directory
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, 'platform.py')):
+                platforms.append((entry.name, entry.path))
+    return tuple(platforms)
+
+
+@functools.lru_cache(maxsize=1)
+def _home_root():
+    """The user's home directory, normalized; the root the QPU scans use."""
+    return os.path.normpath(os.environ.get('HOME') or os.path.expanduser('~'))
+
+
+def _qrc_path():
+    """
+    Platforms directory under the home root, or None if it is unavailable.
+
+    get_platforms_path() memoizes successful lookups itself; failures are
+    left uncached here too so a later call can recover.
+    """
+    qrc_path = get_platforms_path(_home_root())
+    if not qrc_path or not os.path.isdir(qrc_path):
+        return None
+    return qrc_path
+
+
 def get_available_qpus():
     """Get count of available QPUs from the platforms directory."""
-    root = os.path.normpath(os.environ.get('HOME'))
-    qrc_path = get_platforms_path(root)
-    
-    # Check if platforms directory exists
-    if not qrc_path or not os.path.exists(qrc_path):
+    qrc_path = _qrc_path()
+    if qrc_path is None:
         return "N/A"
     
     queues = get_qpu_queue_mapping(qrc_path)
     total_qpus = 0
     online_qpus = 0
+    slurm = None
     
     try:
-        for qpu_name in os.listdir(qrc_path):
-            if qpu_name.startswith(('_', '.')):
-                continue
-            qpu_path = os.path.join(qrc_path, qpu_name)
-            if os.path.isdir(qpu_path) and 'platform.py' in os.listdir(qpu_path):
-                total_qpus += 1
-                
-                # Check if QPU is online using shared function
-                queue_name = queues.get(qpu_name, 'N/A')
-                status = get_connection_status(qpu_name, queue_name)
-                if status in ['online', 'running']:
-                    online_qpus += 1
+        for qpu_name, qpu_path in _scan_platform_dirs(qrc_path):
+            total_qpus += 1
+            
+            # SLURM partition state only: no platform build and no pings,
+            # so the count never waits on a QPU's electronics (the QPU
+            # Status tab runs the full, time-budgeted probes)
+            queue_name = queues.get(qpu_name, 'N/A')
+            if queue_name != 'N/A' and slurm is None:
+                slurm = _slurm_snapshot()
+            status = check_qpu_queue_status(qpu_name, queue_name, slurm)
+            if status in ['online', 'running']:
+                online_qpus += 1
     except OSError:
         return "N/A"
     
     return f"{online_qpus} / {total_qpus}"
 
 
+def _lookup_qibo_versions():
+    """
+    Resolve the installed qibo, qibolab and qibocal versions.
+
+    Uncached; get_qibo_versions() keeps the result for a day. Returns a
+    dict in display order.
+    """
+    logger.debug("Fetching fresh qibo versions")
+    versions = {}
+    packages = ['qibo', 'qibolab', 'qibocal']
+    
+    for package in packages:
+        # Read the installed distribution's metadata: importing the packages
+        # would run their import-time side effects (qibolab's drivers, signal
+        # handlers) just to read __version__
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = 'Not installed'
+        except Exception as e:
+            # e.g. a half-removed install with unreadable metadata
+            versions[package] = f'Error: {str(e)[:50]}'
+    return versions
+
+
 def get_qibo_versions(force_refresh=False, request=None):
     """
     Get versions of qibo, qibolab, and qibocal packages.
@@ -173,9 +380,6 @@ def get_qibo_versions(force_refresh=False, request=None):
     Returns:
         dict: Package versions and cookie update info
     """
-    import time
-    import json
-    
     # Cookie settings
     COOKIE_NAME = 'qibo_versions'
     CACHE_DURATION = 24 * 60 * 60  # 24 hours in seconds
@@ -198,44 +402,25 @@ def get_qibo_versions(force_refresh=False, request=None):
         except (json.JSONDecodeError, KeyError) as e:
             logger.debug(f"Error reading qibo versions cookie: {e}")
     
-    # Fetch fresh versions
-    logger.debug("Fetching fresh qibo versions")
-    versions = {}
-    packages = ['qibo', 'qibolab', 'qibocal']
-    
-    for package in packages:
-        try:
-            import importlib
-            module = importlib.import_module(package)
-            versions[package] = getattr(module, '__version__', 'Unknown')
-        except ImportError as e:
-            # print(f"DEBUG {package}: {e}")
-            versions[package] = 'Not installed'
-        except Exception as e:
-            error_msg = str(e)
-            if "signal only works in main thread" in error_msg:
-                logger.warning(f"Threading error while fetching {package} version: {error_msg}")
-                # Try pip show as fallback for version detection
-                try:
-                    import subprocess
-                    result = subprocess.run(['pip', 'show', package], 
-                                          capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        for line in result.stdout.split('\n'):
-                            if line.startswith('Version:'):
-                                versions[package] = line.split(':', 1)[1].strip()
-                                break
-                        else:
-                            versions[package] = 'Version unknown'
-                    else:
-                        versions[package] = 'Threading error'
-                except Exception:
-                    versions[package] = 'Threading error'
-            else:
-                versions[package] = f'Error: {error_msg[:50]}'
-    
-    # Prepare cookie data
-    current_time = time.time()
+    global _versions_cache
+    with _versions_lock:
+        if not force_refresh and _versions_cache is not None:
+            cached_time, versions = _versions_cache
+            if time.time() - cached_time < _VERSIONS_CACHE_TTL:
+                logger.debug("Using process-cached qibo versions")
+                return {
+                    'versions': dict(versions),
+                    'from_cache': True,
+                    'cookie_data': json.dumps({'versions': versions, 'timestamp': cached_time}),
+                    'cached_at': cached_time
+                }
+
+        # Fetch fresh versions
+        versions = _lookup_qibo_versions()
+
+        # Prepare cookie data
+        current_time = time.time()
+        _versions_cache = (current_time, dict(versions))
     cookie_data = {
         'versions': versions,
         'timestamp': current_time
@@ -249,35 +434,36 @@ def get_qibo_versions(force_refresh=False, request=None):
     }
 
 
+_qpu_list_cache = {}
+
+
+@_ttl_cache(seconds=5, cache=_qpu_list_cache)
 def get_qpu_list():
     """Get list of available QPU platforms tracked in the qibolab platforms git repository.
 
     Only directories committed to the repository's current HEAD are considered, so
     untracked or uncommitted directories (e.g. created via the file browser) are excluded.
     """
-    root = os.path.normpath(os.environ.get('HOME'))
-    qrc_path = get_platforms_path(root)
+    qrc_path = _qrc_path()
     qpus = []
 
-    if qrc_path and os.path.exists(qrc_path):
+    if qrc_path is not None:
         try:
             result = subprocess.run(
-                ['git', '-C', qrc_path, 'ls-tree', '-d', '--name-only', 'HEAD'],
+                ['git', '-C', qrc_path, 'ls-tree', '-d', '-z', '--name-only', 'HEAD'],
                 capture_output=True, text=True, check=True, timeout=10
             )
-            for qpu_name in result.stdout.splitlines():
-                if qpu_name.startswith(('_', '.')):
-                    continue
-                qpu_path = os.path.join(qrc_path, qpu_name)
-                try:
-                    tracked_files = subprocess.run(
-                        ['git', '-C', qrc_path, 'ls-tree', '--name-only', 'HEAD', qpu_name + '/'],
-                        capture_output=True, text=True, check=True, timeout=10
-                    ).stdout.splitlines()
-                except subprocess.CalledProcessError:
-                    continue
-                if 'platform.py' in [os.path.basename(f) for f in tracked_files]:
-                    qpus.append(qpu_name)
+            candidates = [name for name in result.stdout.split('\0')
+                          if name and not name.startswith(('_', '.'))]
+            if candidates:
+                # One ls-tree for every <dir>/platform.py instead of one per
+                # directory; it lists just the paths committed at HEAD
+                result = subprocess.run(
+                    ['git', '-C', qrc_path, 'ls-tree', '-z', '--name-only', 'HEAD', '--']
+                    + [name + '/platform.py' for name in candidates],
+                    capture_output=True, text=True, check=True, timeout=10
+                )
+                qpus = [os.path.dirname(path) for path in result.stdout.split('\0') if path]
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
             pass
 
@@ -288,26 +474,36 @@ def get_qpu_list():
     return sorted(qpus)
 
 
-def get_instruments_ip(platform):
+def clear_qpu_list_cache():
+    """Forget the listed QPUs, e.g. after a branch switch changed them."""
+    _qpu_list_cache.clear()
+
+
+def get_instruments_ip(platform, timeout=None):
+    """Addresses of a platform's instruments, as a tuple, or 'N/A'."""
     # Create a qibolab platform and read the address of the controller
-    backend:QibolabBackend = QibolabBackend(platform=platform)
-    platform:QibolabPlatform = backend.platform
-
-    instruments = platform.instruments
-    ips = []
-    for inst_name in instruments:
-        instrument = instruments[inst_name]
-        # Check if the instrument has a key 'ADDRESS' or 'address'
-        if hasattr(instrument, 'address'):
-            ips.append(instrument.address)
-        elif hasattr(instrument, 'ADDRESS'):
-            ips.append(instrument.ADDRESS)
-    return ips if ips else 'N/A'
-
-
-def qpu_parameters(qpu_name) -> dict:
-    
-    qpu_path = os.path.join(get_platforms_path(), qpu_name)
+    if load_qibolab() is None:
+        return 'N/A'
+    qpu = get_qibolab_platform(platform, os.path.join(get_platforms_path(), platform),
+                               timeout)
+    # Drivers expose the address as either 'address' or 'ADDRESS'
+    ips = tuple(
+        address for instrument in qpu.instruments.values()
+        if (address := getattr(instrument, 'address', None) or getattr(instrument, 'ADDRESS', None))
+    )
+    return ips or 'N/A'
+
+
+def qpu_parameters(qpu_name, qpu_path=None, timeout=None) -> dict:
+    """
+    Qubit count, topology and gates of a QPU.
+
+    *qpu_path* defaults to the QPU's directory under the platforms path;
+    callers that already resolved it can pass it to skip the lookup.
+    *timeout* bounds the wait for the qibolab platform build.
+    """
+    if qpu_path is None:
+        qpu_path = os.path.join(get_platforms_path(), qpu_name)
     
     # Detect qibolab version for this platform
     qibolab_version = detect_and_save_qibolab_version(qpu_path)
@@ -315,9 +511,9 @@ def qpu_parameters(qpu_name) -> dict:
     # Check if version supports new API using PEP 440 compliant comparison
     is_new_api = is_qibolab_new_api(qibolab_version)
     
-    if QIBOLAB_AVAILABLE and is_new_api:
+    if is_new_api and load_qibolab() is not None:
         try:
-            qpu_params = __get_parameters(qpu_name)
+            qpu_params = __get_parameters(qpu_name, qpu_path, timeout)
             logger.debug(f"Retrieved parameters for {qpu_name} using qibolab {qibolab_version} (new API)")
             return qpu_params
         except Exception as e:
@@ -331,6 +527,41 @@ def qpu_parameters(qpu_name) -> dict:
     return qpu_params
 
 
+# A module-level assignment only, optionally annotated; not an indented
+# one, MAX_NUM_QUBITS or a comment
+_NUM_QUBITS_RE = re.compile(rb'^NUM_QUBITS[ \t]*(?::[^=\n]*)?=[ \t]*(\d+)', re.M)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_num_qubits(platform_py_path, mtime):
+    """Last NUM_QUBITS assigned in a platform.py, or 'N/A'; *mtime* keys the cache."""
+    # The whole file is scanned: a later reassignment wins, wherever it is
+    with open(platform_py_path, 'rb') as f:
+        values = _NUM_QUBITS_RE.findall(f.read())
+    return int(values[-1]) if values else 'N/A'
+
+
+# The files get_topology_from_qpu_config reads, in lookup order
+_TOPOLOGY_CONFIG_FILES = ('parameters.json', 'topology.json')
+
+
+def _topology_config_key(qpu_path):
+    """mtime_ns (or None if missing) of each topology config file in *qpu_path*."""
+    key = []
+    for name in _TOPOLOGY_CONFIG_FILES:
+        try:
+            key.append(os.stat(os.path.join(qpu_path, name)).st_mtime_ns)
+        except OSError:
+            key.append(None)
+    return tuple(key)
+
+
+@functools.lru_cache(maxsize=64)
+def _topology_memo(qpu_path, key):
+    """get_topology_from_qpu_config, memoized; *key* invalidates on config edits."""
+    return get_topology_from_qpu_config(qpu_path)
+
+
 def __get_parameters_manual(qpu_path: str):
     """
     Manually extract QPU parameters from configuration files.
@@ -348,17 +579,15 @@ def __get_parameters_manual(qpu_path: str):
     
     # Get qubit count from platform.py
     platform_py_path = os.path.join(qpu_path, 'platform.py')
-    if os.path.exists(platform_py_path):
-        with open(platform_py_path, 'r') as f:
-            for line in f:
-                if 'NUM_QUBITS' in line:
-                    try:
-                        num_qubits = int(line.split('=')[1].strip())
-                    except (ValueError, IndexError):
-                        continue
+    try:
+        mtime = os.stat(platform_py_path).st_mtime_ns
+    except OSError:
+        pass
+    else:
+        num_qubits = _read_num_qubits(platform_py_path, mtime)
     
     # Infer topology from configuration files
-    topology = get_topology_from_qpu_config(qpu_path)
+    topology = _topology_memo(qpu_path, _topology_config_key(qpu_path))
     qpu_name = qpu_path.split(os.sep)[-1]  # Get the last part of the path as the QPU name
     return {
                     'name': qpu_name,
@@ -369,17 +598,8 @@ def __get_parameters_manual(qpu_path: str):
                 }
 
 
-def __get_parameters(platform) -> dict:
+def __get_parameters(platform, qpu_path, timeout=None) -> dict:
     """Get available parameters for a specific qibolab Platform."""
-    class SignalDisabler:
-        def __enter__(self):
-            self.old_signal = signal.signal
-            signal.signal = lambda sig, handler: None
-            return self
-        
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            signal.signal = self.old_signal
-
     parameters = {
                     'name': platform,
                     'nqubits': 'Unknown',
@@ -390,105 +610,79 @@ def __get_parameters(platform) -> dict:
     
     try:
         # Try to create the platform to get its parameters
-        with SignalDisabler():
-            try:
-                qpu: QibolabPlatform = create_platform(platform)
-            except Exception as e:
-                logger.warning(f"Could not create platform {platform}: {e}")
-                logger.debug(f"Full traceback:\n{traceback.format_exc()}")
-                parameters['error'] = traceback.format_exc()
-                return parameters
-
-            try:
-                # Extract information about the platform
-                parameters = {
-                    'name': platform,
-                    'nqubits': len(qpu.qubits) if hasattr(qpu, 'qubits') else 'Unknown',
-                    'topology': 'Connected' if hasattr(qpu, 'pairs') and qpu.pairs else 'Not available',
-                    'single_qubit_gates': {},  # Format: {gate_name: [list_of_qubits]}
-                    'two_qubit_gates': {},     # Format: {gate_name: [list_of_qubit_pairs]}
-                    'gates': []  # Keep for backward compatibility
-                }
+        try:
+            qpu = get_qibolab_platform(platform, qpu_path, timeout)
+        except Exception as e:
+            logger.warning(f"Could not create platform {platform}: {e}")
+            # Returned to API callers, so it is formatted anyway; the debug
+            # log reuses it rather than walking the stack a second time
+            parameters['error'] = traceback.format_exc()
+            logger.debug(f"Full traceback:\n{parameters['error']}")
+            return parameters
 
-                from qibolab._core.parameters import NativeGates, SingleQubitNatives, TwoQubitNatives
-                # Try to get available gates/operations per qubit 
-                if hasattr(qpu, 'natives') and qpu.natives:
-                    natives: NativeGates = qpu.natives
-                    single_qubit_natives: SingleQubitNatives = natives.single_qubit
-                    two_qubit_natives: TwoQubitNatives = natives.two_qubit
-
-                    logger.debug(f"Processing single-qubit gates for {qpu.nqubits} qubits")
-                    
-                    # Process single-qubit gates
-                    for qubit in range(qpu.nqubits):
-                        qubit_name, _= qpu.qubit(qubit)
-                        qubit_gates:SingleQubitNatives = single_qubit_natives[qubit_name]
-                        
-                        # Handle different formats of gate storage
-                        if hasattr(qubit_gates, 'items'):
-                            # Dictionary-like access
-                            for gate_name, gate_info in qubit_gates.items():
-                                if gate_info is not None:  # Only include gates that are not None
-                                    if gate_name not in parameters['single_qubit_gates']:
-                                        parameters['single_qubit_gates'][gate_name] = []
-                                    parameters['single_qubit_gates'][gate_name].append(str(qubit_name))
-                                    
-                                    # Add to legacy gates list for backward compatibility
-                                    if gate_name not in parameters['gates']:
-                                        parameters['gates'].append(gate_name)
-                        else:
-                            # Iterable format
-                            for gate_name, gate_info in qubit_gates:
-                                if gate_info is not None:  # Only include gates that are not None
-                                    if gate_name not in parameters['single_qubit_gates']:
-                                        parameters['single_qubit_gates'][gate_name] = []
-                                    parameters['single_qubit_gates'][gate_name].append(str(qubit_name))
-                                    
-                                    # Add to legacy gates list for backward compatibility
-                                    if gate_name not in parameters['gates']:
-                                        parameters['gates'].append(gate_name)
-
-                    # Process two-qubit gates
-                    logger.debug("Processing two-qubit gates")
-                    if hasattr(two_qubit_natives, 'items'):
-                        # Dictionary-like access
-                        for qubit_pair, pair_gates in two_qubit_natives.items():
-                            if hasattr(pair_gates, 'items'):
-                                for gate_name, gate_info in pair_gates.items():
-                                    if gate_info is not None:  # Only include gates that are not None
-                                        if gate_name not in parameters['two_qubit_gates']:
-                                            parameters['two_qubit_gates'][gate_name] = []
-                                        parameters['two_qubit_gates'][gate_name].append(qubit_pair)
-                                        
-                                        # Add to legacy gates list for backward compatibility
-                                        if gate_name not in parameters['gates']:
-                                            parameters['gates'].append(gate_name)
-                            else:
-                                # Iterable format
-                                for gate_name, gate_info in pair_gates:
-                                    if gate_info is not None:  # Only include gates that are not None
-                                        if gate_name not in parameters['two_qubit_gates']:
-                                            parameters['two_qubit_gates'][gate_name] = []
-                                        parameters['two_qubit_gates'][gate_name].append(qubit_pair)
-                                        
-                                        # Add to legacy gates list for backward compatibility
-                                        if gate_name not in parameters['gates']:
-                                            parameters['gates'].append(gate_name)
-
-                    logger.info(f"Found {len(parameters['single_qubit_gates'])} single-qubit gate types and {len(parameters['two_qubit_gates'])} two-qubit gate types")
-                
-                # Infer topology from configuration files
-                topology = get_topology_from_platform(qpu)
-                parameters['topology'] = topology
+        try:
+            # Extract information about the platform
+            parameters = {
+                'name': platform,
+                'nqubits': len(qpu.qubits) if hasattr(qpu, 'qubits') else 'Unknown',
+                'topology': 'Connected' if hasattr(qpu, 'pairs') and qpu.pairs else 'Not available',
+                'single_qubit_gates': {},  # Format: {gate_name: [list_of_qubits]}
+                'two_qubit_gates': {},     # Format: {gate_name: [list_of_qubit_pairs]}
+                'gates': []  # Keep for backward compatibility
+            }
+
+            from qibolab._core.parameters import NativeGates, SingleQubitNatives, TwoQubitNatives
+            # Try to get available gates/operations per qubit 
+            if hasattr(qpu, 'natives') and qpu.natives:
+                natives: NativeGates = qpu.natives
+                single_qubit_natives: SingleQubitNatives = natives.single_qubit
+                two_qubit_natives: TwoQubitNatives = natives.two_qubit
+
+                logger.debug(f"Processing single-qubit gates for {qpu.nqubits} qubits")
+                sq_map = parameters['single_qubit_gates']
+                tq_map = parameters['two_qubit_gates']
+
+                # Process single-qubit gates; iterate the qubit names directly
+                # rather than resolving each index through qpu.qubit()
+                qubits = qpu.qubits
+                qubit_names = list(qubits.keys()) if hasattr(qubits, 'keys') else list(qubits)
+                for qubit_name in qubit_names:
+                    qubit_gates:SingleQubitNatives = single_qubit_natives[qubit_name]
+                    qubit_label = str(qubit_name)
+
+                    # Handle both dictionary-like and iterable gate storage
+                    gate_items = qubit_gates.items() if hasattr(qubit_gates, 'items') else qubit_gates
+                    for gate_name, gate_info in gate_items:
+                        if gate_info is not None:  # Only include gates that are not None
+                            sq_map.setdefault(gate_name, []).append(qubit_label)
+
+                # Process two-qubit gates
+                logger.debug("Processing two-qubit gates")
+                if hasattr(two_qubit_natives, 'items'):
+                    for qubit_pair, pair_gates in two_qubit_natives.items():
+                        gate_items = pair_gates.items() if hasattr(pair_gates, 'items') else pair_gates
+                        for gate_name, gate_info in gate_items:
+                            if gate_info is not None:  # Only include gates that are not None
+                                tq_map.setdefault(gate_name, []).append(qubit_pair)
+
+                # Legacy flat list for backward compatibility: every gate name
+                # once, in first-seen order (the maps keep insertion order)
+                parameters['gates'] = list(dict.fromkeys([*sq_map, *tq_map]))
+
+                logger.info(f"Found {len(parameters['single_qubit_gates'])} single-qubit gate types and {len(parameters['two_qubit_gates'])} two-qubit gate types")
+            
+            # Infer topology from configuration files
+            topology = get_topology_from_platform(qpu)
+            parameters['topology'] = topology
 
-                return parameters
-                
-            except Exception as platform_error:
-                logger.warning(f"Error processing platform {platform}: {platform_error}")
-                logger.debug(f"Full traceback:\n{traceback.format_exc()}")
-                parameters['error'] = str(e.with_traceback)
-                return parameters
+            return parameters
             
+        except Exception as platform_error:
+            logger.warning(f"Error processing platform {platform}: {platform_error}")
+            logger.debug("Full traceback", exc_info=True)  # formatted only if emitted
+            parameters['error'] = str(platform_error)
+            return parameters
+        
     except ImportError:
         logger.warning("qibolab is not available. Cannot retrieve QPU parameters.")
         return {
@@ -500,33 +694,74 @@ def __get_parameters(platform) -> dict:
         }
     
 
+def _remaining(deadline):
+    """Seconds left until a time.monotonic() *deadline*; None if there is none."""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def _budgeted_parameters(qpu_name, qpu_path, deadline):
+    """qpu_parameters(), waiting for the platform build until *deadline*."""
+    return qpu_parameters(qpu_name, qpu_path, _remaining(deadline))
+
+
+def _finished(future):
+    """True if *future* exists and ran to completion within the budget."""
+    return future is not None and future.done() and not future.cancelled()
+
+
 def get_qpu_details():
     """Get detailed information about all available QPUs."""
-    
-    root = os.path.normpath(os.environ.get('HOME'))
-    platforms_path = get_platforms_path(root)
+    platforms_path = _qrc_path()
     qpus_list = []
+    if platforms_path is None:
+        return qpus_list
     qpu_names = get_qpu_list()
 
     # Get queue mapping using shared function
     queues = get_qpu_queue_mapping(platforms_path)
 
-    if os.path.exists(platforms_path):
-        for qpu_name in qpu_names:
-                queue_name = queues.get(qpu_name, 'N/A')
-                status = get_connection_status(qpu_name, queue_name)
-                qpu_params = qpu_parameters(qpu_name)
-                qpus_list.append({
-                    'name': qpu_name,
-                    'qubits': qpu_params.get('nqubits', 'N/A'),
-                    'status': status,
-                    'queue': queue_name,
-                    'topology': qpu_params.get('topology', 'N/A'),
-                    'calibration_time': 'N/A'
-                })
+    if qpu_names:
+        queue_names = [queues.get(qpu_name, 'N/A') for qpu_name in qpu_names]
+
+        # Probes are dominated by subprocess/network waits, so the status
+        # check and the parameter lookup of every QPU all run side by side.
+        # A QPU without a queue is offline; there is nothing to probe (and
+        # SLURM is only queried if some QPU has one). Probes get the deadline
+        # too, so a slow platform build frees its worker when the budget
+        # runs out instead of holding it into the next refresh.
+        deadline = time.monotonic() + _HEALTH_BUDGET_S
+        probes = [
+            (_PROBE_POOL.submit(_budgeted_connection_status, qpu_name, queue_name,
+                                deadline)
+             if queue_name != 'N/A' else None,
+             _PARAMS_POOL.submit(_budgeted_parameters, qpu_name,
+                                 os.path.join(platforms_path, qpu_name), deadline))
+            for qpu_name, queue_name in zip(qpu_names, queue_names)
+        ]
+        _, late = wait([f for pair in probes for f in pair if f is not None],
+                       timeout=_remaining(deadline))
+        if late:
+            for future in late:
+                future.cancel()  # only drops those that haven't started
+            logger.warning(f"{len(late)} QPU probe(s) exceeded the {_HEALTH_BUDGET_S}s budget")
+
+        for qpu_name, queue_name, (status_future, params_future) in zip(qpu_names, queue_names, probes):
+            if status_future is None:
+                status = 'offline'
+            elif _finished(status_future):
+                status = status_future.result()
+            else:
+                status = 'connection error'
+            qpu_params = params_future.result() if _finished(params_future) else {}
+            qpus_list.append({
+                'name': qpu_name,
+                'qubits': qpu_params.get('nqubits', 'N/A'),
+                'status': status,
+                'queue': queue_name,
+                'topology': qpu_params.get('topology', 'N/A'),
+                'calibration_time': 'N/A'
+            })
 
     return  qpus_list
-
-
-
-
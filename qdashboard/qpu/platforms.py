@@ -3,6 +3,7 @@ Utilities for managing qibolab platforms directory using git.
 """
 
 import os
+import json
 import subprocess
 import logging
 import glob
@@ -130,7 +131,7 @@ def update_platforms_repository(platforms_path):
     Returns:
         bool: True if update was successful, False otherwise
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return False
     
@@ -165,11 +166,74 @@ def get_platforms_path(root_path=None):
     Returns:
         str: Path to platforms directory, or None if unable to ensure it exists
     """
+    # Successful lookups are memoized per (root_path, QIBOLAB_PLATFORMS);
+    # failures are retried on the next call.
+    key = (root_path, os.environ.get('QIBOLAB_PLATFORMS'))
+    cached = _platforms_path_cache.get(key)
+    if cached is not None:
+        return cached
     try:
-        return ensure_platforms_directory(root_path)
+        platforms_path = ensure_platforms_directory(root_path)
     except Exception as e:
         logger.error(f"Unable to ensure platforms directory: {e}")
         return None
+    _platforms_path_cache[key] = platforms_path
+    return platforms_path
+
+
+_platforms_path_cache = {}
+
+
+_git_dir_cache = {}
+
+
+def _git_dir(platforms_path):
+    """
+    Git directory of the repository checked out at *platforms_path*, or None.
+
+    Follows the ``gitdir:`` pointer file that worktrees and submodules use in
+    place of a .git directory. Found paths are memoized (a checkout's git dir
+    does not move); misses are re-checked, as the repository may be cloned
+    later.
+    """
+    git_dir = _git_dir_cache.get(platforms_path)
+    if git_dir is not None:
+        return git_dir
+    dot_git = os.path.join(platforms_path, '.git')
+    if os.path.isdir(dot_git):
+        git_dir = dot_git
+    else:
+        try:
+            with open(dot_git, 'r') as f:
+                pointer = f.read().strip()
+        except OSError:
+            return None
+        if not pointer.startswith('gitdir:'):
+            return None
+        git_dir = os.path.normpath(os.path.join(platforms_path, pointer[len('gitdir:'):].strip()))
+    _git_dir_cache[platforms_path] = git_dir
+    return git_dir
+
+
+def _current_branch(platforms_path):
+    """
+    Name of the checked-out branch, or '' when HEAD is detached.
+
+    Reads HEAD from the git directory instead of spawning
+    `git branch --show-current`; falls back to git if that fails.
+    """
+    git_dir = _git_dir(platforms_path)
+    try:
+        if git_dir is None:
+            raise FileNotFoundError(os.path.join(platforms_path, '.git'))
+        with open(os.path.join(git_dir, 'HEAD'), 'r') as f:
+            head = f.read().strip()
+    except OSError:
+        branch_cmd = ['git', '-C', platforms_path, 'branch', '--show-current']
+        branch_result = subprocess.run(branch_cmd, check=True, capture_output=True, text=True)
+        return branch_result.stdout.strip()
+    prefix = 'ref: refs/heads/'
+    return head[len(prefix):] if head.startswith(prefix) else ''
 
 
 def list_repository_branches(platforms_path):
@@ -187,30 +251,29 @@ def list_repository_branches(platforms_path):
             'remote': ['origin/main', 'origin/feature-branch', 'origin/develop']
         }
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return None
     
     try:
         # Get current branch
-        current_cmd = ['git', '-C', platforms_path, 'branch', '--show-current']
-        current_result = subprocess.run(current_cmd, check=True, capture_output=True, text=True)
-        current_branch = current_result.stdout.strip()
-        
-        # Get local branches
-        local_cmd = ['git', '-C', platforms_path, 'branch', '--format=%(refname:short)']
-        local_result = subprocess.run(local_cmd, check=True, capture_output=True, text=True)
-        local_branches = [branch.strip() for branch in local_result.stdout.split('\n') if branch.strip()]
+        current_branch = _current_branch(platforms_path)
         
         # Fetch latest remote information
         fetch_cmd = ['git', '-C', platforms_path, 'fetch', '--all']
         subprocess.run(fetch_cmd, check=True, capture_output=True, text=True)
         
-        # Get remote branches
-        remote_cmd = ['git', '-C', platforms_path, 'branch', '-r', '--format=%(refname:short)']
-        remote_result = subprocess.run(remote_cmd, check=True, capture_output=True, text=True)
-        remote_branches = [branch.strip() for branch in remote_result.stdout.split('\n') 
-                          if branch.strip() and not branch.strip().endswith('/HEAD')]
+        # Local and remote branches from one ref listing
+        refs_cmd = ['git', '-C', platforms_path, 'for-each-ref', '--format=%(refname)',
+                    'refs/heads', 'refs/remotes']
+        refs_result = subprocess.run(refs_cmd, check=True, capture_output=True, text=True)
+        local_branches = []
+        remote_branches = []
+        for ref in refs_result.stdout.split():
+            if ref.startswith('refs/heads/'):
+                local_branches.append(ref[len('refs/heads/'):])
+            elif not ref.endswith('/HEAD'):
+                remote_branches.append(ref[len('refs/remotes/'):])
         
         logger.info(f"Retrieved branch information for platforms repository")
         
@@ -244,7 +307,7 @@ def stash_changes(platforms_path, stash_message="WIP: Temporary stash"):
             'stash_name': 'stash@{0}' (if success=True)
         }
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return {'success': False, 'error': 'Not a git repository'}
     
@@ -300,7 +363,7 @@ def apply_latest_stash(platforms_path, pop=True):
             'conflicts': True/False (if conflicts occurred during apply)
         }
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return {'success': False, 'error': 'Not a git repository'}
     
@@ -368,7 +431,7 @@ def discard_changes(platforms_path):
             'discarded_files': ['file1.py', 'file2.json'] (if success=True)
         }
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return {'success': False, 'error': 'Not a git repository'}
     
@@ -431,7 +494,7 @@ def list_stashes(platforms_path):
             'stashes': [{'name': 'stash@{0}', 'message': 'WIP: ...', 'date': '...'}]
         }
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return {'success': False, 'error': 'Not a git repository'}
     
@@ -490,7 +553,7 @@ def switch_repository_branch(platforms_path, branch_name, create_if_not_exists=F
             'stash_restored': True/False
         }
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return {'success': False, 'error': 'Not a git repository'}
     
@@ -621,54 +684,37 @@ def get_current_branch_info(platforms_path):
             'clean': True
         }
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return None
     
     try:
-        # Get current branch
-        branch_cmd = ['git', '-C', platforms_path, 'branch', '--show-current']
-        branch_result = subprocess.run(branch_cmd, check=True, capture_output=True, text=True)
-        current_branch = branch_result.stdout.strip()
-        
-        # Get current commit hash
-        commit_cmd = ['git', '-C', platforms_path, 'rev-parse', '--short', 'HEAD']
-        commit_result = subprocess.run(commit_cmd, check=True, capture_output=True, text=True)
-        current_commit = commit_result.stdout.strip()
-        
-        # Get commit message
-        message_cmd = ['git', '-C', platforms_path, 'log', '-1', '--pretty=format:%s']
-        message_result = subprocess.run(message_cmd, check=True, capture_output=True, text=True)
-        commit_message = message_result.stdout.strip()
-        
-        # Check if repository is clean
-        status_cmd = ['git', '-C', platforms_path, 'status', '--porcelain']
+        # Fetch first to get latest remote info for the ahead/behind counts
+        fetched = subprocess.run(['git', '-C', platforms_path, 'fetch'],
+                                 capture_output=True, text=True).returncode == 0
+        
+        # Short hash and subject of the latest commit, in one call
+        log_cmd = ['git', '-C', platforms_path, 'log', '-1', '--pretty=format:%h%x00%s']
+        log_result = subprocess.run(log_cmd, check=True, capture_output=True, text=True)
+        current_commit, _, commit_message = log_result.stdout.strip().partition('\0')
+        
+        # Branch name, ahead/behind and working tree state from a single
+        # `git status`: '# branch.*' header lines, then one line per change
+        status_cmd = ['git', '-C', platforms_path, 'status', '--porcelain=v2', '--branch']
         status_result = subprocess.run(status_cmd, check=True, capture_output=True, text=True)
-        is_clean = not bool(status_result.stdout.strip())
-        
-        # Get ahead/behind information if there's an upstream
+        current_branch = ''
         ahead, behind = 0, 0
-        try:
-            # Fetch first to get latest remote info
-            subprocess.run(['git', '-C', platforms_path, 'fetch'], 
-                          check=True, capture_output=True, text=True)
-            
-            # Check if there's an upstream branch
-            upstream_cmd = ['git', '-C', platforms_path, 'rev-parse', '--abbrev-ref', f'{current_branch}@{{upstream}}']
-            upstream_result = subprocess.run(upstream_cmd, capture_output=True, text=True)
-            
-            if upstream_result.returncode == 0:
-                upstream_branch = upstream_result.stdout.strip()
-                
-                # Get ahead/behind counts
-                counts_cmd = ['git', '-C', platforms_path, 'rev-list', '--left-right', '--count', 
-                             f'{upstream_branch}...{current_branch}']
-                counts_result = subprocess.run(counts_cmd, check=True, capture_output=True, text=True)
-                behind, ahead = map(int, counts_result.stdout.strip().split())
-                
-        except subprocess.CalledProcessError:
-            # No upstream or other error, keep defaults
-            pass
+        is_clean = True
+        for line in status_result.stdout.splitlines():
+            if line.startswith('# branch.head '):
+                head = line[len('# branch.head '):]
+                current_branch = '' if head == '(detached)' else head
+            elif line.startswith('# branch.ab '):
+                if fetched:
+                    plus, minus = line[len('# branch.ab '):].split()
+                    ahead, behind = int(plus), -int(minus)
+            elif not line.startswith('#'):
+                is_clean = False
         
         return {
             'branch': current_branch,
@@ -779,7 +825,7 @@ def commit_changes(platforms_path, commit_message=None):
             'branch_info': {...}
         }
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return {'success': False, 'error': 'Not a git repository'}
 
@@ -846,15 +892,13 @@ def push_changes(platforms_path):
             'branch_info': {...}
         }
     """
-    if not os.path.exists(os.path.join(platforms_path, '.git')):
+    if _git_dir(platforms_path) is None:
         logger.warning(f"Not a git repository: {platforms_path}")
         return {'success': False, 'error': 'Not a git repository'}
     
     try:
         # Get current branch
-        branch_cmd = ['git', '-C', platforms_path, 'branch', '--show-current']
-        branch_result = subprocess.run(branch_cmd, check=True, capture_output=True, text=True)
-        current_branch = branch_result.stdout.strip()
+        current_branch = _current_branch(platforms_path)
         
         # Check if there are any commits to push
         ahead_cmd = ['git', '-C', platforms_path, 'rev-list', '--count', f'origin/{current_branch}..HEAD']
@@ -890,6 +934,22 @@ def push_changes(platforms_path):
         logger.error(error_msg)
         return {'success': False, 'error': error_msg}
 
+# queues.json path -> (st_mtime_ns, parsed mapping)
+_queues_cache = {}
+
+
+def _load_queues(queues_file):
+    """Parse queues.json, reusing the previous parse while its mtime is unchanged."""
+    mtime = os.stat(queues_file).st_mtime_ns
+    cached = _queues_cache.get(queues_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(queues_file, 'r') as f:
+        queues_data = json.load(f)
+    _queues_cache[queues_file] = (mtime, queues_data)
+    return queues_data
+
+
 def get_partition(platform):
     """
     Get the partition name from a platform name by reading the queues.json file.
@@ -914,9 +974,7 @@ def get_partition(platform):
     
     if os.path.exists(queues_file):
         try:
-            import json
-            with open(queues_file, 'r') as f:
-                queues_data = json.load(f)
+            queues_data = _load_queues(queues_file)
             
             # Look up the platform in the queues mapping
             if platform in queues_data:
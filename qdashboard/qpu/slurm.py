@@ -4,6 +4,11 @@ SLURM queue management and monitoring utilities.
 
 import os
 import subprocess
+from collections import Counter
+
+# Timeout for squeue/sinfo calls; an unresponsive slurmctld must not stall
+# a page
+SLURM_TIMEOUT_S = 5
 
 
 def get_slurm_status():
@@ -75,7 +80,7 @@ def check_slurm_job_status(job_id) -> str:
     try:
         result = subprocess.run(
             ['squeue', '-j', str(job_id), '--noheader', '--format=%T'],
-            capture_output=True, text=True, timeout=10
+            capture_output=True, text=True, timeout=SLURM_TIMEOUT_S
         )
         lines = [ln.strip() for ln in result.stdout.splitlines() if ln.strip()]
         if lines:
@@ -85,17 +90,61 @@ def check_slurm_job_status(job_id) -> str:
         return 'UNKNOWN'
 
 
-def check_queue_running_jobs(queue_name):
-    """Check if there are running jobs in a specific SLURM queue."""
+def get_job_states(job_ids):
+    """SLURM states of several jobs with a single squeue call.
+
+    Args:
+        job_ids: Iterable of SLURM job ids.
+
+    Returns:
+        dict mapping job id (as a string) to its state, e.g. 'RUNNING', for
+        the jobs still in the queue. Jobs that left the queue are missing;
+        the dict is empty if squeue is unavailable, fails or times out.
+    """
+    job_ids = sorted({str(job_id) for job_id in job_ids})
+    if not job_ids:
+        return {}
     try:
-        # Use squeue to check for running jobs in the specific partition
-        squeue_output = subprocess.check_output(['squeue', '-p', queue_name, '-t', 'RUNNING'], 
-                                               stderr=subprocess.DEVNULL).decode()
-        # If there's output beyond the header line, there are running jobs
-        lines = squeue_output.strip().split('\n')
-        return len(lines) > 1  # More than just the header line means there are running jobs
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False  # If command fails, assume no running jobs
+        # No check: squeue exits non-zero when some ids are no longer known,
+        # but still lists the ones that are
+        result = subprocess.run(
+            ['squeue', '-j', ','.join(job_ids), '--noheader', '-o', '%i %T'],
+            capture_output=True, text=True, timeout=SLURM_TIMEOUT_S
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return {}
+    states = {}
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            states[parts[0]] = parts[1]
+    return states
+
+
+def get_running_partitions(partitions=None):
+    """Count RUNNING jobs per SLURM partition with a single squeue call.
+
+    Args:
+        partitions: Optional iterable of partition names to restrict the
+            query to; all partitions when omitted.
+
+    Returns:
+        collections.Counter mapping partition name to running job count.
+        Empty if squeue is unavailable, fails or times out.
+    """
+    cmd = ['squeue', '--noheader', '-t', 'RUNNING', '-o', '%P']
+    if partitions is not None:
+        partitions = sorted(set(partitions))
+        if not partitions:
+            return Counter()
+        cmd += ['-p', ','.join(partitions)]
+    try:
+        output = subprocess.check_output(cmd, stderr=subprocess.DEVNULL,
+                                         timeout=SLURM_TIMEOUT_S).decode()
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        return Counter()
+    # A job submitted to several partitions lists them comma-separated
+    return Counter(name for line in output.split() for name in line.split(','))
 
 
 def slurm_log_path():
@@ -7,11 +7,18 @@ import json
 import yaml
 import base64
 import io
-import signal
 import traceback
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from qdashboard.utils.logger import get_logger
 from qdashboard.qpu.platforms import get_platforms_path
-from qdashboard.qpu.utils import detect_and_save_qibolab_version, is_qibolab_new_api, get_qibolab_version_from_file
+from qdashboard.qpu.utils import (
+    detect_and_save_qibolab_version, is_qibolab_new_api, get_qibolab_version_from_file,
+    load_qibolab, get_qibolab_platform,
+)
+
+if TYPE_CHECKING:
+    from qibolab import Platform  # only imported lazily at runtime, see load_qibolab()
 
 try:
     import rustworkx as rx
@@ -31,29 +38,12 @@ except ImportError:
     HAS_MATPLOTLIB = False
     print("Warning: matplotlib not available. Topology visualization will be limited.")
 
-# Optional qibolab imports
-try:
-    from qibolab._core.backends import QibolabBackend
-    from qibolab._core.platform.platform import Platform as QibolabPlatform
-    QIBOLAB_AVAILABLE = True
-except ImportError:
-    QIBOLAB_AVAILABLE = False
-
 logger = get_logger(__name__)
 
 def qpu_connectivity(qpu_name):
     """
     Extract connectivity data from QPU.
     """
-    class SignalDisabler:
-        def __enter__(self):
-            self.old_signal = signal.signal
-            signal.signal = lambda sig, handler: None
-            return self
-        
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            signal.signal = self.old_signal
-
     # Detect qibolab version for this platform
     platforms_path = get_platforms_path()
     qpu_path = os.path.join(platforms_path, qpu_name)
@@ -62,13 +52,12 @@ def qpu_connectivity(qpu_name):
     # Check if version supports new API using PEP 440 compliant comparison
     is_new_api = is_qibolab_new_api(qibolab_version)
 
-    if QIBOLAB_AVAILABLE and is_new_api:
-        # Use QibolabPlatform to get connectivity data
+    qibolab = load_qibolab() if is_new_api else None
+    if qibolab is not None:
+        # Use the qibolab Platform to get connectivity data
         try:
-            with SignalDisabler():
-                backend:QibolabBackend = QibolabBackend(platform=qpu_name)
-                platform:QibolabPlatform = backend.platform
-                return platform.pairs if platform.pairs else None
+            platform = get_qibolab_platform(qpu_name, qpu_path)
+            return platform.pairs if platform.pairs else None
         except Exception as e:
             logger.warning(f"Failed to load QPU {qpu_name} with new API, falling back to config files: {e}")
             return get_connectivity_data_from_qpu_config(qpu_path)
@@ -180,7 +169,20 @@ def infer_topology_from_connectivity(connectivity_data):
     """
     if not connectivity_data or not HAS_RUSTWORKX:
         return 'unknown'
-    
+
+    # The same few connectivity lists come back on every dashboard refresh,
+    # so the graph analysis is memoized on a hashable copy of the edges
+    try:
+        edges = tuple(tuple(connection) for connection in connectivity_data)
+        hash(edges)
+    except TypeError:
+        return _classify_connectivity.__wrapped__(connectivity_data)
+    return _classify_connectivity(edges)
+
+
+@lru_cache(maxsize=64)
+def _classify_connectivity(connectivity_data):
+    """infer_topology_from_connectivity() for non-empty *connectivity_data*."""
     try:
         # Create a graph using rustworkx
         graph = rx.PyGraph()
@@ -282,7 +284,7 @@ def infer_topology_from_connectivity(connectivity_data):
         print(f"Error analyzing topology: {e}")
         return 'unknown'
 
-def get_topology_from_platform(platform: QibolabPlatform) -> str:
+def get_topology_from_platform(platform: "Platform") -> str:
     """
     Extract topology information from platform configuration.
     
@@ -292,8 +294,9 @@ def get_topology_from_platform(platform: QibolabPlatform) -> str:
     Returns:
         str: Inferred topology type
     """
-    if QIBOLAB_AVAILABLE:
-        if type(platform) is QibolabPlatform:
+    qibolab = load_qibolab()
+    if qibolab is not None:
+        if type(platform) is qibolab.Platform:
             return infer_topology_from_connectivity(platform.pairs)
         else:
             raise TypeError("Invalid platform type.")
@@ -1,5 +1,10 @@
 import os
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import SimpleNamespace
 from packaging import version
 from qdashboard.utils.logger import get_logger
 
@@ -119,4 +124,110 @@ def get_qibolab_version_from_file(qpu_path):
         return versions_data.get('qibolab_version')
     except (IOError, json.JSONDecodeError) as e:
         logger.warning(f"Could not read qibolab_version from versions.json: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+@lru_cache(maxsize=1)
+def load_qibolab():
+    """
+    Import the qibolab entry points used by the dashboard, on first use.
+
+    qibolab pulls in its instrument drivers at import, and some of them
+    install signal handlers, which only works on the main thread. The
+    server's startup calls this there once; later calls from worker
+    threads get the cached result.
+
+    Returns:
+        SimpleNamespace with QibolabBackend, Platform and create_platform,
+        or None if qibolab is not installed
+    """
+    try:
+        from qibolab import create_platform
+        from qibolab._core.backends import QibolabBackend
+        from qibolab._core.platform.platform import Platform
+    except ImportError:
+        return None
+    return SimpleNamespace(QibolabBackend=QibolabBackend, Platform=Platform,
+                           create_platform=create_platform)
+
+
+# qibolab platforms are only ever built on this one thread: driver set-up
+# isn't meant to run concurrently, and a hung build only ever ties up this
+# thread.
+_qibolab_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='qibolab')
+_PLATFORM_BUILD_TIMEOUT_S = 60  # includes waiting behind other builds
+# Files a platform is built from; their mtimes key the cache below
+_PLATFORM_FILES = ('platform.py', 'parameters.json', 'calibration.json')
+# qpu_name -> (files_key, Future) of its latest build, finished or not,
+# least recently used first
+_platform_builds = OrderedDict()
+_PLATFORM_CACHE_SIZE = 16
+_platform_builds_lock = threading.Lock()
+
+
+def get_qibolab_platform(qpu_name, qpu_path, timeout=None):
+    """
+    The qibolab Platform for *qpu_name*, built once per version of its files.
+
+    The _PLATFORM_CACHE_SIZE most recently used platforms are kept.
+
+    Concurrent callers share one build. A caller that gives up after
+    *timeout* leaves the build running, and later calls wait on it
+    rather than queueing another one behind it.
+
+    Args:
+        qpu_name: Platform name, as passed to qibolab's create_platform
+        qpu_path: The platform's directory, whose files key the cache
+        timeout: Seconds to wait for the build; defaults to
+            _PLATFORM_BUILD_TIMEOUT_S
+
+    Raises:
+        ImportError: If qibolab is not installed
+        concurrent.futures.TimeoutError: If the build didn't finish in time
+        Exception: Whatever create_platform raised; failures aren't cached
+    """
+    if load_qibolab() is None:
+        raise ImportError("qibolab is not available")
+    files_key = []
+    for name in _PLATFORM_FILES:
+        try:
+            files_key.append(os.stat(os.path.join(qpu_path, name)).st_mtime_ns)
+        except OSError:
+            files_key.append(None)
+    files_key = tuple(files_key)
+
+    with _platform_builds_lock:
+        build = _platform_builds.get(qpu_name)
+        if (build is None or build[0] != files_key
+                or (build[1].done() and build[1].exception() is not None)):
+            build = (files_key, _qibolab_executor.submit(_create_platform, qpu_name))
+            _platform_builds[qpu_name] = build
+        _platform_builds.move_to_end(qpu_name)
+        # Evict the least recently used finished builds; running ones stay
+        # so their callers keep sharing them
+        for name in list(_platform_builds):
+            if len(_platform_builds) <= _PLATFORM_CACHE_SIZE:
+                break
+            if _platform_builds[name][1].done():
+                del _platform_builds[name]
+    return build[1].result(
+        timeout=_PLATFORM_BUILD_TIMEOUT_S if timeout is None else timeout)
+
+
+def _create_platform(qpu_name):
+    try:
+        return load_qibolab().create_platform(qpu_name)
+    except ValueError as e:
+        if not str(e).startswith('signal only works in main thread'):
+            raise
+        # A driver that registers signal handlers when the platform is
+        # created can't be set up from the build thread
+        raise RuntimeError(
+            f"Platform {qpu_name} installs signal handlers on creation and "
+            f"can't be built outside the main thread") from e
+
+
+def clear_platform_cache():
+    """Forget built platforms, so the next lookup rebuilds them."""
+    with _platform_builds_lock:
+        _platform_builds.clear()
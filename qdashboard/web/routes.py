@@ -16,7 +16,10 @@ from fastapi import APIRouter, Request, Form, File, UploadFile, Query, HTTPExcep
 from fastapi.responses import FileResponse, Response, StreamingResponse, RedirectResponse
 from starlette.responses import HTMLResponse
 
-from ..qpu.monitoring import get_available_qpus, get_qibo_versions, get_qpu_details, get_qpu_list, qpu_parameters
+from ..qpu.monitoring import (
+    clear_qpu_list_cache, get_available_qpus, get_qibo_versions, get_qpu_details, get_qpu_list,
+    qpu_parameters,
+)
 from ..qpu.platforms import get_platforms_path, list_repository_branches, switch_repository_branch, get_current_branch_info, commit_changes, generate_commit_message, push_changes, stash_changes, list_stashes, apply_latest_stash, discard_changes, get_partition
 from ..qpu.slurm import get_slurm_status, get_slurm_output
 from ..qpu.topology import qpu_connectivity, infer_topology_from_connectivity, generate_topology_visualization
@@ -207,7 +210,8 @@ async def shell(request: Request):
         history_qpus=history_qpus,
     )
     response = HTMLResponse(content=html, headers=_no_cache_headers())
-    if not version_data.get('from_cache', False):
+    # Process-cache hits still carry cookie_data for clients without one
+    if 'cookie_data' in version_data:
         response.set_cookie('qibo_versions', version_data['cookie_data'],
                             max_age=24 * 60 * 60, httponly=True, secure=False)
     return response
@@ -414,6 +418,9 @@ async def api_platforms_switch(request: Request):
                     'has_changes': switch_result.get('has_changes', False),
                 }),
                 status_code=400, media_type='application/json')
+        # The tracked platforms differ per branch; built qibolab platforms are
+        # keyed by their files' mtimes, which the checkout updates
+        clear_qpu_list_cache()
         current_branch_info = get_current_branch_info(platforms_path)
         qpu_details = get_qpu_details()
         response_data = {
@@ -856,7 +863,9 @@ async def repeat_experiment_route(request: Request,
             return Response(content=json.dumps({'success': False,
                             'message': 'Invalid report path'}),
                             status_code=400, media_type='application/json')
-        result = repeat_experiment(safe, config)
+        # sbatch blocks for up to 30 s — keep it off the event loop so
+        # concurrent submissions overlap instead of queueing behind it
+        result = await asyncio.to_thread(repeat_experiment, safe, config)
         if result['success']:
             logger.info(f"Experiment repeat submitted: {result['experiment_id']}")
             return _sanitize_exp(result)
@@ -886,7 +895,8 @@ async def submit_experiment_route(request: Request,
             tmp.write(runcard_content)
             tmp_path = tmp.name
         try:
-            result = submit_experiment(tmp_path, config, environment)
+            result = await asyncio.to_thread(submit_experiment, runcard_path=tmp_path,
+                                             config=config, environment=environment)
             if result['success']:
                 logger.info(f"New experiment submitted: {result['experiment_id']}")
                 return _sanitize_exp(result)
@@ -925,8 +935,9 @@ async def submit_experiment_data_route(request: Request):
             return Response(content=json.dumps({'success': False,
                             'message': 'Missing required field: platform'}),
                             status_code=400, media_type='application/json')
-        result = submit_experiment(runcard_data=runcard_data, config=config, environment=environment,
-                                   auto_update=auto_update, node_name=node_name)
+        result = await asyncio.to_thread(submit_experiment, runcard_data=runcard_data, config=config,
+                                         environment=environment, auto_update=auto_update,
+                                         node_name=node_name)
         if result['success']:
             logger.info(f"New experiment submitted with data: {result['experiment_id']}")
             return _sanitize_exp(result)
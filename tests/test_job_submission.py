@@ -0,0 +1,41 @@
+"""Tests for experiment status listing."""
+
+import json
+import subprocess
+
+from qdashboard.experiments.job_submission import list_user_experiments
+from qdashboard.qpu import slurm
+
+
+def _experiment(data_dir, experiment_id, job_id, submitted_at):
+    experiment_dir = data_dir / 'qpu1' / '20260101' / experiment_id
+    (experiment_dir / 'output').mkdir(parents=True)
+    (experiment_dir / 'experiment_metadata.json').write_text(json.dumps({
+        'experiment_id': experiment_id,
+        'job_id': job_id,
+        'experiment_dir': str(experiment_dir),
+        'output_dir': str(experiment_dir / 'output'),
+        'submitted_at': submitted_at,
+    }))
+
+
+def test_list_user_experiments_queries_squeue_once(tmp_path, monkeypatch):
+    _experiment(tmp_path, 'running', '11', 2)
+    _experiment(tmp_path, 'finished', '12', 1)
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout='11 RUNNING\n', stderr='')
+
+    monkeypatch.setattr(slurm.subprocess, 'run', fake_run)
+
+    experiments = list_user_experiments({'data_dir': str(tmp_path)})
+
+    assert len(calls) == 1
+    assert [(e['experiment_id'], e['status']) for e in experiments] == [
+        ('running', 'running'),
+        ('finished', 'running'),  # left the queue, output dir without a report yet
+    ]
+    assert experiments[0]['slurm_state'] == 'RUNNING'
+    assert experiments[1]['slurm_state'] == 'UNKNOWN'
@@ -0,0 +1,204 @@
+"""Tests for the QPU monitoring probes."""
+
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from types import SimpleNamespace
+
+import pytest
+
+from qdashboard.qpu import monitoring, utils
+
+
+@pytest.fixture
+def hung_qibolab(monkeypatch):
+    """A qibolab whose create_platform blocks until the test ends."""
+    release = threading.Event()
+    calls = []
+
+    def create_platform(name):
+        calls.append(name)
+        release.wait(10)
+        return SimpleNamespace(qubits={}, instruments={})
+
+    monkeypatch.setattr(utils, 'load_qibolab',
+                        lambda: SimpleNamespace(create_platform=create_platform))
+    utils.clear_platform_cache()
+    yield calls
+    release.set()
+    utils.clear_platform_cache()
+
+
+def test_hung_platform_build_times_out_and_is_shared(hung_qibolab, tmp_path):
+    for _ in range(2):
+        started = time.monotonic()
+        with pytest.raises(FutureTimeoutError):
+            utils.get_qibolab_platform('hung', str(tmp_path), timeout=0.1)
+        assert time.monotonic() - started < 1
+
+    # The second caller waited on the first build rather than queueing another
+    assert hung_qibolab == ['hung']
+
+
+def test_signal_error_from_build_thread_is_reported(monkeypatch, tmp_path):
+    def create_platform(name):
+        raise ValueError('signal only works in main thread of the main interpreter')
+
+    monkeypatch.setattr(utils, 'load_qibolab',
+                        lambda: SimpleNamespace(create_platform=create_platform))
+    utils.clear_platform_cache()
+    try:
+        with pytest.raises(RuntimeError, match="outside the main thread"):
+            utils.get_qibolab_platform('sig', str(tmp_path), timeout=5)
+    finally:
+        utils.clear_platform_cache()
+
+
+def test_platform_cache_evicts_least_recently_used(monkeypatch, tmp_path):
+    monkeypatch.setattr(utils, 'load_qibolab', lambda: SimpleNamespace(
+        create_platform=lambda name: SimpleNamespace(name=name)))
+    monkeypatch.setattr(utils, '_PLATFORM_CACHE_SIZE', 2)
+    utils.clear_platform_cache()
+    try:
+        for name in ('a', 'b', 'a', 'c'):
+            utils.get_qibolab_platform(name, str(tmp_path), timeout=5)
+        assert list(utils._platform_builds) == ['a', 'c']
+    finally:
+        utils.clear_platform_cache()
+
+
+def test_hung_probe_does_not_starve_next_call(hung_qibolab, tmp_path, monkeypatch):
+    def fake_parameters(qpu_name, qpu_path=None, timeout=None):
+        if qpu_name.startswith('hung'):
+            try:
+                utils.get_qibolab_platform(qpu_name, qpu_path, timeout)
+            except FutureTimeoutError:
+                return {'nqubits': 'Unknown', 'topology': 'Unknown'}
+        return {'nqubits': 5, 'topology': 'line'}
+
+    pool = ThreadPoolExecutor(max_workers=2)
+    monkeypatch.setattr(monitoring, '_PARAMS_POOL', pool)
+    monkeypatch.setattr(monitoring, '_HEALTH_BUDGET_S', 0.3)
+    monkeypatch.setattr(monitoring, 'qpu_parameters', fake_parameters)
+    monkeypatch.setattr(monitoring, '_qrc_path', lambda: str(tmp_path))
+    monkeypatch.setattr(monitoring, 'get_qpu_queue_mapping', lambda path: {})
+
+    try:
+        # Occupy every parameter worker with a build that never finishes
+        monkeypatch.setattr(monitoring, 'get_qpu_list', lambda: ['hung1', 'hung2'])
+        started = time.monotonic()
+        assert len(monitoring.get_qpu_details()) == 2
+        assert time.monotonic() - started < 2
+
+        monkeypatch.setattr(monitoring, 'get_qpu_list', lambda: ['ok'])
+        (qpu,) = monitoring.get_qpu_details()
+        assert qpu['qubits'] == 5
+        assert qpu['status'] == 'offline'
+    finally:
+        pool.shutdown(wait=False)
+
+
+def test_versions_process_cache_hit_returns_a_copy(monkeypatch):
+    monkeypatch.setattr(monitoring, '_versions_cache', None)
+    monkeypatch.setattr(monitoring, '_lookup_qibo_versions', lambda: {'qibo': '1.0'})
+
+    fresh = monitoring.get_qibo_versions()
+    assert fresh['from_cache'] is False
+    fresh['versions']['qibo'] = 'changed'
+
+    cached = monitoring.get_qibo_versions()
+    assert cached['from_cache'] is True
+    assert cached['versions'] == {'qibo': '1.0'}
+    cached['versions']['qibo'] = 'changed'
+    assert monitoring.get_qibo_versions()['versions'] == {'qibo': '1.0'}
+
+
+@pytest.mark.parametrize('source, expected', [
+    ('NUM_QUBITS = 5\n', 5),
+    ('NUM_QUBITS: int = 5\n', 5),
+    ('def create():\n    NUM_QUBITS = 3\n', 'N/A'),
+    ('MAX_NUM_QUBITS = 9\n# NUM_QUBITS = 4\nNUM_QUBITS = 2\n', 2),
+    ('NUM_QUBITS = 5\nNUM_QUBITS = 3\n', 3),
+])
+def test_read_num_qubits(tmp_path, source, expected):
+    path = tmp_path / 'platform.py'
+    path.write_text(source)
+    assert monitoring._read_num_qubits(str(path), 0) == expected
+
+
+def test_read_num_qubits_takes_the_last_assignment(tmp_path):
+    path = tmp_path / 'platform.py'
+    path.write_text('NUM_QUBITS = 5\n' + '#' * 9000 + '\nNUM_QUBITS = 21\n')
+    assert monitoring._read_num_qubits(str(path), 0) == 21
+
+
+def test_ttl_cache_runs_concurrent_misses_once():
+    calls = []
+    release = threading.Event()
+
+    @monitoring._ttl_cache(seconds=60)
+    def slow(key):
+        calls.append(key)
+        release.wait(5)
+        return key * 2
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(slow, 3) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        assert [f.result() for f in futures] == [6, 6, 6, 6]
+    assert calls == [3]
+
+
+def test_ttl_cache_drops_expired_entries(monkeypatch):
+    cache = {}
+    now = [0.0]
+    monkeypatch.setattr(monitoring, 'time', SimpleNamespace(monotonic=lambda: now[0]))
+
+    @monitoring._ttl_cache(seconds=5, cache=cache)
+    def double(key):
+        return key * 2
+
+    double(1)
+    now[0] = 10.0
+    double(2)
+    assert list(cache) == [(2,)]
+
+
+@pytest.fixture
+def online_queue(monkeypatch):
+    """SLURM reports partition 'q' up, with nothing running."""
+    monkeypatch.setattr(monitoring, '_slurm_snapshot',
+                        lambda: {'partitions': {'q'}, 'running_partitions': Counter()})
+
+
+def test_over_budget_connection_status_is_not_cached(online_queue, monkeypatch):
+    builds = iter([FutureTimeoutError(), ('10.0.0.1',)])
+
+    def fake_instruments_ip(qpu_name, timeout=None):
+        result = next(builds)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(monitoring, 'get_instruments_ip', fake_instruments_ip)
+    monkeypatch.setattr(monitoring, '_ping_all', lambda ips: True)
+
+    deadline = time.monotonic() + 5
+    assert monitoring._budgeted_connection_status('budget_qpu', 'q', deadline) == 'connection error'
+    assert monitoring._budgeted_connection_status('budget_qpu', 'q', deadline) == 'online'
+
+
+def test_available_qpus_counts_from_slurm_only(online_queue, tmp_path, monkeypatch):
+    def no_probe(*args, **kwargs):
+        raise AssertionError('get_available_qpus must not build or ping')
+
+    monkeypatch.setattr(monitoring, 'get_instruments_ip', no_probe)
+    monkeypatch.setattr(monitoring, '_ping_all', no_probe)
+    monkeypatch.setattr(monitoring, '_qrc_path', lambda: str(tmp_path))
+    monkeypatch.setattr(monitoring, 'get_qpu_queue_mapping', lambda path: {'a': 'q', 'b': 'down'})
+    monkeypatch.setattr(monitoring, '_scan_platform_dirs',
+                        lambda path: [('a', ''), ('b', ''), ('c', '')])
+
+    assert monitoring.get_available_qpus() == '1 / 3'
@@ -0,0 +1,78 @@
+"""Tests for the platforms repository helpers."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from qdashboard.qpu.platforms import get_current_branch_info
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason='git is not installed')
+
+
+def _git(cwd, *args):
+    return subprocess.run(['git', '-C', str(cwd), *args], check=True,
+                          capture_output=True, text=True).stdout.strip()
+
+
+def _commit(repo, name):
+    (repo / name).write_text(name)
+    _git(repo, 'add', name)
+    _git(repo, 'commit', '-q', '-m', f'Add {name}')
+
+
+@pytest.fixture
+def clones(tmp_path, monkeypatch):
+    """Two clones of one origin, on branch main."""
+    for var in ('AUTHOR', 'COMMITTER'):
+        monkeypatch.setenv(f'GIT_{var}_NAME', 'Test')
+        monkeypatch.setenv(f'GIT_{var}_EMAIL', 'test@example.com')
+    monkeypatch.setenv('GIT_CONFIG_NOSYSTEM', '1')
+    monkeypatch.setenv('HOME', str(tmp_path))
+
+    origin = tmp_path / 'origin.git'
+    _git(tmp_path, 'init', '-q', '--bare', '-b', 'main', str(origin))
+    seed = tmp_path / 'seed'
+    _git(tmp_path, 'clone', '-q', str(origin), str(seed))
+    _git(seed, 'checkout', '-q', '-b', 'main')
+    _commit(seed, 'first')
+    _git(seed, 'push', '-q', 'origin', 'main')
+
+    work = tmp_path / 'work'
+    _git(tmp_path, 'clone', '-q', str(origin), str(work))
+    return work, seed
+
+
+def test_branch_info_counts_ahead_and_behind(clones):
+    work, other = clones
+    _commit(work, 'local1')
+    _commit(work, 'local2')
+    _commit(other, 'remote')
+    _git(other, 'push', '-q', 'origin', 'main')
+
+    info = get_current_branch_info(str(work))
+
+    assert info == {
+        'branch': 'main',
+        'commit': _git(work, 'rev-parse', '--short', 'HEAD'),
+        'commit_message': 'Add local2',
+        'ahead': 2,
+        'behind': 1,
+        'clean': True,
+    }
+
+
+def test_branch_info_reports_changes_and_detached_head(clones):
+    work, _ = clones
+    (work / 'first').write_text('changed')
+    _git(work, 'checkout', '-q', '--detach')
+
+    info = get_current_branch_info(str(work))
+
+    assert info['branch'] == ''
+    assert (info['ahead'], info['behind']) == (0, 0)
+    assert info['clean'] is False
+
+
+def test_branch_info_outside_a_repository(tmp_path):
+    assert get_current_branch_info(str(tmp_path)) is None
@@ -0,0 +1,38 @@
+"""Tests for qibocal protocol discovery."""
+
+from qdashboard.experiments.protocols import _categorize_protocols
+
+
+def _protocol(class_name, module_name):
+    return {'class_name': class_name, 'module_name': module_name}
+
+
+def test_categorize_protocols_first_matching_rule_wins():
+    # Matches both Spectroscopy and Readout; Spectroscopy is checked first
+    protocol = _protocol('qubit_spectroscopy', 'qibocal.protocols.readout')
+    assert _categorize_protocols([protocol]) == {'Spectroscopy': [protocol]}
+
+
+def test_categorize_protocols_already_unique_keeps_input():
+    first = _protocol('rabi_amplitude', 'a')
+    second = _protocol('rabi_amplitude', 'b')
+    categorized = _categorize_protocols([first, second], already_unique=True)
+    assert categorized == {'Characterization': [first, second]}
+
+
+def test_categorize_protocols():
+    rabi = _protocol('rabi_amplitude', 'qibocal.protocols.rabi.amplitude')
+    t1 = _protocol('t1', 'qibocal.protocols.coherence.t1')
+    spectroscopy = _protocol('resonator_spectroscopy', 'qibocal.protocols.resonator_spectroscopy')
+    mystery = _protocol('mystery', 'somewhere.else')
+
+    categorized = _categorize_protocols([mystery, spectroscopy, t1, rabi, dict(rabi)])
+
+    # Categories come in display order, duplicates by class name are dropped
+    assert categorized == {
+        'Characterization': [rabi],
+        'Coherence': [t1],
+        'Spectroscopy': [spectroscopy],
+        'Other': [mystery],
+    }
+    assert list(categorized) == ['Characterization', 'Coherence', 'Spectroscopy', 'Other']
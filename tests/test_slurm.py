@@ -0,0 +1,61 @@
+"""Tests for the SLURM queries."""
+
+import subprocess
+from collections import Counter
+
+import pytest
+
+from qdashboard.qpu import slurm
+
+
+def test_running_partitions_counts_multi_partition_jobs(monkeypatch):
+    calls = []
+
+    def fake_check_output(cmd, **kwargs):
+        calls.append(cmd)
+        return b'qpu1\nqpu2\nqpu1,qpu2\n'
+
+    monkeypatch.setattr(slurm.subprocess, 'check_output', fake_check_output)
+
+    assert slurm.get_running_partitions(['qpu2', 'qpu1', 'qpu2']) == Counter(qpu1=2, qpu2=2)
+    # One squeue call, restricted to the distinct partitions asked for
+    (cmd,) = calls
+    assert cmd[cmd.index('-p') + 1] == 'qpu1,qpu2'
+
+
+def test_running_partitions_without_partitions_skips_squeue(monkeypatch):
+    def fail(cmd, **kwargs):
+        raise AssertionError('squeue should not run')
+
+    monkeypatch.setattr(slurm.subprocess, 'check_output', fail)
+    assert slurm.get_running_partitions([]) == Counter()
+
+
+@pytest.mark.parametrize('error', [
+    FileNotFoundError('squeue'),
+    subprocess.TimeoutExpired('squeue', 3),
+    subprocess.CalledProcessError(1, 'squeue'),
+])
+def test_running_partitions_is_empty_when_squeue_fails(monkeypatch, error):
+    def raise_error(cmd, **kwargs):
+        raise error
+
+    monkeypatch.setattr(slurm.subprocess, 'check_output', raise_error)
+    assert slurm.get_running_partitions() == Counter()
+
+
+def test_job_states_uses_one_squeue_call(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        # Job 3 has left the queue; squeue still lists the others
+        return subprocess.CompletedProcess(cmd, 1, stdout='1 RUNNING\n2 PENDING\n', stderr='')
+
+    monkeypatch.setattr(slurm.subprocess, 'run', fake_run)
+
+    assert slurm.get_job_states([2, '1', 3, 2]) == {'1': 'RUNNING', '2': 'PENDING'}
+    (cmd,) = calls
+    assert cmd[cmd.index('-j') + 1] == '1,2,3'
+    assert slurm.get_job_states([]) == {}
+    assert len(calls) == 1